@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import json
 from google import genai
 from google.genai import types as genai_types
@@ -113,18 +114,10 @@ class BusinessAnalystAgent:
                 }
 
                 # Fetch business photos from Google Maps
-                logger.info("Fetching business photos from Google Maps...")
-                place_id = self._extract_place_id_from_maps_data(business_input.business_address)
-                if place_id:
-                    maps_photos = self.google_services.get_place_photos(place_id)
-                    if maps_photos:
-                        # Add to existing photos array (may already have social media photos)
-                        profile['photos'].extend(maps_photos)
-                        logger.info(f"Retrieved {len(maps_photos)} photos from Google Maps")
-                    else:
-                        logger.info("No photos available from Google Maps")
-                else:
-                    logger.warning("Could not extract place_id for photo fetching")
+                # Add to existing photos array (may already have social media photos)
+                profile['photos'].extend(
+                    await asyncio.to_thread(self._fetch_maps_photos, business_input.business_address)
+                )
 
         # Step 3: Synthesize content themes
         profile['content_themes'] = await self._generate_content_themes(profile)
@@ -135,6 +128,58 @@ class BusinessAnalystAgent:
 
         return profile
 
+    async def fetch_photos_only(self, business_input: BusinessInput) -> Dict:
+        """
+        Fetch Google Maps photos without running the full analysis.
+
+        Skips website analysis, reviews, trends and Gemini theme generation,
+        so it is cheap enough to call when only photos are needed.
+
+        Returns minimal business profile with:
+        - business_name
+        - photos (from Google Maps)
+        """
+        logger.info("Business Analyst Agent: Fetching photos only...")
+
+        profile = {
+            'business_name': business_input.business_name or '',
+            'photos': []
+        }
+
+        if not business_input.business_address:
+            logger.warning("No business address provided, cannot fetch photos")
+            return profile
+
+        profile['photos'].extend(
+            await asyncio.to_thread(self._fetch_maps_photos, business_input.business_address)
+        )
+
+        return profile
+
+    def _fetch_maps_photos(self, address: str) -> List[Dict]:
+        """
+        Look up the place_id for an address and fetch its Google Maps photos.
+
+        Makes blocking googlemaps calls, so async callers run it with
+        asyncio.to_thread.
+
+        Returns:
+            List of photo dicts (empty if the place or its photos can't be found)
+        """
+        logger.info("Fetching business photos from Google Maps...")
+        place_id = self._extract_place_id_from_maps_data(address)
+        if not place_id:
+            logger.warning("Could not extract place_id for photo fetching")
+            return []
+
+        maps_photos = self.google_services.get_place_photos(place_id)
+        if maps_photos:
+            logger.info(f"Retrieved {len(maps_photos)} photos from Google Maps")
+            return maps_photos
+
+        logger.info("No photos available from Google Maps")
+        return []
+
     async def _parse_website_analysis(self, analysis_text: str) -> Dict:
         """Parse website analysis text into structured data"""
         if not self.genai_client or not analysis_text:
@@ -6,12 +6,14 @@ Autonomous agent that generates 7-day social media campaign with captions, image
 Architecture:
 - Step 0: Retrieve ALL campaign data (research + analytics) from Convex
 - Step 1: Create 7-day content strategy (Gemini HIGH thinking)
-- Step 2: For each day (1-7):
+- Step 2: For each day (1-7), generated concurrently:
   - Generate caption (Gemini LOW thinking)
   - Generate image prompt (Gemini LOW thinking)
   - Generate 2 images with MiniMax
   - Upload images to R2
   - For days 1, 4, 7: Generate video (MiniMax image-to-video)
+  - Checkpoint the finished day to disk, so a rerun after a crash
+    resumes from the completed days instead of starting over
 - Step 3: Store CreativeOutput in Convex
 - Step 4: Extract and store learning data for self-improvement
 
@@ -24,6 +26,11 @@ Key Principles (CLAUDE.md):
 
 import logging
 import asyncio
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -41,6 +48,128 @@ from services.r2_service import R2Service
 
 logger = logging.getLogger(__name__)
 
+# Where in-progress campaigns are checkpointed (override with CREATIVE_CHECKPOINT_DIR)
+DEFAULT_CHECKPOINT_DIR = Path(__file__).parent.parent / "outputs" / "checkpoints"
+
+
+@contextmanager
+def timed(telemetry: List[Dict[str, Any]], phase: str, day: Optional[int] = None):
+    """Record how long the wrapped block took as {phase, day, seconds}"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        telemetry.append({
+            "phase": phase,
+            "day": day,
+            "seconds": round(time.perf_counter() - start, 3)
+        })
+
+
+class ProgressBatcher:
+    """
+    Coalesces campaign progress updates into periodic Convex writes.
+
+    set() only records the latest update; a background task writes it at
+    most once per interval, so updates superseded in between are never
+    sent. close() stops the task and writes the final status (or whatever
+    is still pending), so it always lands; set() after close() is ignored,
+    so late updates can't overwrite the final status.
+    """
+
+    def __init__(self, convex_service: ConvexService, campaign_id: str, interval: float = 2.0):
+        self.convex = convex_service
+        self.campaign_id = campaign_id
+        self.interval = interval
+        self._pending: Optional[Dict[str, Any]] = None
+        self._lock = asyncio.Lock()
+        self._closed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush task"""
+        self._task = asyncio.create_task(self._flush_loop())
+
+    def set(self, **update: Any) -> None:
+        """Record an update_progress() call, replacing any unsent one"""
+        if self._closed.is_set():
+            return
+        self._pending = update
+
+    async def flush(self) -> None:
+        """Write the pending update, if any; writes never overlap"""
+        async with self._lock:
+            update, self._pending = self._pending, None
+            if update is not None:
+                await self.convex.update_progress(campaign_id=self.campaign_id, **update)
+
+    async def close(self, **final_update: Any) -> None:
+        """
+        Stop the background task and write final_update, or the last
+        pending update if none is given. Safe to call more than once.
+        """
+        self._closed.set()
+        if self._task is not None:
+            await self._task
+        if final_update:
+            self._pending = final_update
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._closed.wait(), timeout=self.interval)
+                return  # close() does the final flush
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Progress update failed: {e}")
+
+
+class CreativeCheckpointer:
+    """
+    Persists creative generation progress so a crashed run can resume.
+
+    One JSON file per campaign holds the content strategy and every day
+    completed so far: {"strategy": {...}, "days": {"1": DayContent, ...}}.
+    Writes go to a temp file and are renamed into place, so a crash
+    mid-write leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, checkpoint_dir: Optional[Path] = None):
+        self.checkpoint_dir = Path(
+            checkpoint_dir or os.getenv("CREATIVE_CHECKPOINT_DIR", DEFAULT_CHECKPOINT_DIR)
+        )
+
+    def _path(self, campaign_id: str) -> Path:
+        return self.checkpoint_dir / f"{campaign_id}.json"
+
+    def load(self, campaign_id: str) -> Dict[str, Any]:
+        """Return the saved state for campaign_id, or {} if there is none"""
+        path = self._path(campaign_id)
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return {}
+
+    def save(self, campaign_id: str, state: Dict[str, Any]) -> None:
+        """Atomically replace the saved state for campaign_id"""
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(campaign_id)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state, default=str))
+        os.replace(tmp_path, path)
+
+    def clear(self, campaign_id: str) -> None:
+        """Remove the checkpoint once the campaign is stored"""
+        self._path(campaign_id).unlink(missing_ok=True)
+
 
 class CreativeAgent:
     """
@@ -63,16 +192,25 @@ class CreativeAgent:
         gemini_service: GeminiService,
         minimax_service: MiniMaxService,
         convex_service: ConvexService,
-        r2_service: R2Service
+        r2_service: R2Service,
+        checkpointer: Optional[CreativeCheckpointer] = None
     ):
         self.gemini = gemini_service
         self.minimax = minimax_service
         self.convex = convex_service
         self.r2 = r2_service
+        self.checkpointer = checkpointer or CreativeCheckpointer()
 
         # Video generation days (1, 4, 7)
         self.video_days = [1, 4, 7]
 
+        # Days are generated concurrently; these bound in-flight MiniMax
+        # requests, one semaphore per endpoint since image and video
+        # generation are rate limited separately
+        max_concurrent = int(os.getenv("CREATIVE_MAX_CONCURRENT", "4"))
+        self.image_semaphore = asyncio.BoundedSemaphore(max_concurrent)
+        self.video_semaphore = asyncio.BoundedSemaphore(max_concurrent)
+
         logger.info("Creative Agent initialized")
 
     async def run(self, campaign_id: str) -> CreativeOutput:
@@ -87,10 +225,14 @@ class CreativeAgent:
         """
         logger.info(f"🎨 Creative Agent starting for campaign: {campaign_id}")
 
+        # Progress goes to Convex through a batcher, so the per-day updates
+        # don't each cost a round-trip on the generation path
+        batcher = ProgressBatcher(self.convex, campaign_id)
+        batcher.start()
+
         try:
             # Update progress: 50% → 55%
-            await self.convex.update_progress(
-                campaign_id=campaign_id,
+            batcher.set(
                 status="agent3_running",
                 progress=50,
                 current_agent="creative",
@@ -103,49 +245,109 @@ class CreativeAgent:
             analytics: AnalyticsOutput = campaign_data["analytics"]
 
             # Update progress: 55% → 60%
-            await self.convex.update_progress(
-                campaign_id=campaign_id,
+            batcher.set(
                 status="agent3_running",
                 progress=55,
                 current_agent="creative",
                 message="Creating content strategy with Gemini HIGH thinking"
             )
 
-            # Step 1: Create 7-day content strategy (Gemini HIGH thinking)
-            strategy = await self._create_content_strategy(research, analytics)
-            logger.info(f"✓ Content strategy created: {len(strategy['days'])} days")
+            # Per-phase timings for this run, returned as creative_output.telemetry
+            telemetry: List[Dict[str, Any]] = []
+
+            # Step 1: Create 7-day content strategy (Gemini HIGH thinking),
+            # or resume from the checkpoint of an earlier, interrupted run
+            checkpoint = await asyncio.to_thread(self.checkpointer.load, campaign_id)
+            if checkpoint.get("strategy"):
+                strategy = checkpoint["strategy"]
+                logger.info(f"✓ Resuming from checkpoint: {len(checkpoint['days'])} days already complete")
+            else:
+                with timed(telemetry, "content_strategy"):
+                    strategy = await self._create_content_strategy(research, analytics)
+                logger.info(f"✓ Content strategy created: {len(strategy['days'])} days")
+                checkpoint = {"strategy": strategy, "days": {}}
+                await asyncio.to_thread(self.checkpointer.save, campaign_id, checkpoint)
+
+            checkpointed_days = {
+                int(day_num): DayContent.model_validate(day)
+                for day_num, day in checkpoint["days"].items()
+            }
 
-            # Update progress: 60% → 90% (will increment per day)
+            # Update progress: 60% → 90% (will increment per completed day)
             progress_per_day = 30 / 7  # 30% progress for 7 days
 
-            # Step 2: Generate content for each day
-            days_content: List[DayContent] = []
+            batcher.set(
+                status="agent3_running",
+                progress=60,
+                current_agent="creative",
+                message=f"Generating content for {len(strategy['days'])} days"
+            )
 
-            for day_plan in strategy["days"]:
+            # Step 2: Generate content for each day
+            business_context = research.business_context.model_dump()
+            completed_days = 0
+            # Serializes checkpoint writes from the concurrent day tasks so
+            # they don't race on the temp file
+            checkpoint_lock = asyncio.Lock()
+
+            async def generate_day(day_plan: Dict[str, Any]) -> DayContent:
+                nonlocal completed_days
                 day_num = day_plan["day"]
 
-                await self.convex.update_progress(
-                    campaign_id=campaign_id,
-                    status="agent3_running",
-                    progress=int(60 + (day_num - 1) * progress_per_day),
-                    current_agent="creative",
-                    message=f"Generating Day {day_num} content: {day_plan['theme']}"
-                )
+                if day_num in checkpointed_days:
+                    completed_days += 1
+                    logger.info(f"✓ Day {day_num} restored from checkpoint")
+                    return checkpointed_days[day_num]
 
                 day_content = await self._generate_day_content(
                     campaign_id=campaign_id,
                     day_plan=day_plan,
-                    business_context=research.business_context.model_dump(),
+                    business_context=business_context,
                     customer_favorites=analytics.customer_sentiment.popular_items,
-                    research_images=research.research_images
+                    research_images=research.research_images,
+                    telemetry=telemetry
+                )
+
+                # Checkpoint each finished day so a later failure doesn't
+                # throw away its generated media. The dump and write run on a
+                # worker thread from a snapshot, since other days keep adding
+                # to the checkpoint while it is being written
+                checkpoint["days"][str(day_num)] = day_content.model_dump(mode="json")
+                async with checkpoint_lock:
+                    snapshot = {**checkpoint, "days": dict(checkpoint["days"])}
+                    await asyncio.to_thread(self.checkpointer.save, campaign_id, snapshot)
+
+                completed_days += 1
+                batcher.set(
+                    status="agent3_running",
+                    progress=int(60 + completed_days * progress_per_day),
+                    current_agent="creative",
+                    message=f"Day {day_num} content complete: {day_plan['theme']}"
                 )
 
-                days_content.append(day_content)
                 logger.info(f"✓ Day {day_num} content complete")
+                return day_content
+
+            # Days don't depend on each other, so generate them concurrently;
+            # MiniMax requests are bounded by the per-endpoint semaphores.
+            # gather keeps the days in strategy order. If any day fails (or
+            # run() is cancelled), the remaining days are cancelled and
+            # awaited so none outlives run() to keep calling MiniMax/R2 or
+            # report progress after the failure is recorded
+            day_tasks = [
+                asyncio.ensure_future(generate_day(day_plan))
+                for day_plan in strategy["days"]
+            ]
+            try:
+                days_content: List[DayContent] = list(await asyncio.gather(*day_tasks))
+            except BaseException:
+                for task in day_tasks:
+                    task.cancel()
+                await asyncio.gather(*day_tasks, return_exceptions=True)
+                raise
 
             # Update progress: 90% → 95%
-            await self.convex.update_progress(
-                campaign_id=campaign_id,
+            batcher.set(
                 status="agent3_running",
                 progress=90,
                 current_agent="creative",
@@ -153,11 +355,12 @@ class CreativeAgent:
             )
 
             # Step 3: Extract learning data (self-improvement)
-            learning_data = await self._extract_learnings(
-                research=research,
-                analytics=analytics,
-                days_content=days_content
-            )
+            with timed(telemetry, "learning_extraction"):
+                learning_data = await self._extract_learnings(
+                    research=research,
+                    analytics=analytics,
+                    days_content=days_content
+                )
 
             # Step 4: Create final output
             creative_output = CreativeOutput(
@@ -165,12 +368,12 @@ class CreativeAgent:
                 days=days_content,
                 learning_data=learning_data,
                 status="completed",
-                timestamp=datetime.now()
+                timestamp=datetime.now(),
+                telemetry=telemetry
             )
 
             # Update progress: 95% → 100%
-            await self.convex.update_progress(
-                campaign_id=campaign_id,
+            batcher.set(
                 status="agent3_running",
                 progress=95,
                 current_agent="creative",
@@ -179,9 +382,9 @@ class CreativeAgent:
 
             # Step 5: Store in Convex
             await self.convex.store_content(creative_output)
+            self.checkpointer.clear(campaign_id)
 
-            await self.convex.update_progress(
-                campaign_id=campaign_id,
+            await batcher.close(
                 status="completed",
                 progress=100,
                 current_agent="creative",
@@ -193,13 +396,16 @@ class CreativeAgent:
 
         except Exception as e:
             logger.error(f"❌ Creative Agent failed: {e}", exc_info=True)
-            await self.convex.update_progress(
-                campaign_id=campaign_id,
-                status="failed",
-                progress=50,
-                current_agent="creative",
-                message=f"Generation failed: {str(e)}"
-            )
+            # A failed status write must not mask the generation error
+            try:
+                await batcher.close(
+                    status="failed",
+                    progress=50,
+                    current_agent="creative",
+                    message=f"Generation failed: {str(e)}"
+                )
+            except Exception as close_error:
+                logger.error(f"Failed to record failed status: {close_error}")
             raise
 
     async def _retrieve_campaign_data(self, campaign_id: str) -> Dict[str, Any]:
@@ -259,7 +465,8 @@ class CreativeAgent:
         day_plan: Dict[str, Any],
         business_context: Dict[str, Any],
         customer_favorites: List[str],
-        research_images: List[str] = []
+        research_images: List[str] = [],
+        telemetry: Optional[List[Dict[str, Any]]] = None
     ) -> DayContent:
         """
         Step 2: Generate complete content for one day
@@ -271,24 +478,30 @@ class CreativeAgent:
         4. Upload images to R2
         5. If day 1, 4, or 7: Generate video (MiniMax image-to-video)
         6. Upload video to R2
+
+        Each step's duration is appended to telemetry when given.
         """
         day_num = day_plan["day"]
         logger.info(f"Generating Day {day_num}: {day_plan['theme']}")
+        if telemetry is None:
+            telemetry = []
 
         try:
             # Task 1: Generate caption (Gemini LOW thinking)
-            caption = await self.gemini.generate_caption(
-                day_plan=day_plan,
-                business_context=business_context
-            )
+            with timed(telemetry, "caption_generation", day_num):
+                caption = await self.gemini.generate_caption(
+                    day_plan=day_plan,
+                    business_context=business_context
+                )
             logger.info(f"✓ Day {day_num} caption generated ({len(caption)} chars)")
 
             # Task 2: Generate image prompt (Gemini LOW thinking)
-            image_prompt = await self.gemini.generate_image_prompt(
-                day_plan=day_plan,
-                business_context=business_context,
-                customer_favorites=customer_favorites
-            )
+            with timed(telemetry, "image_prompt", day_num):
+                image_prompt = await self.gemini.generate_image_prompt(
+                    day_plan=day_plan,
+                    business_context=business_context,
+                    customer_favorites=customer_favorites
+                )
             logger.info(f"✓ Day {day_num} image prompt: {image_prompt[:50]}...")
 
             # Task 3: Generate 2 images (MiniMax)
@@ -299,28 +512,32 @@ class CreativeAgent:
                 subject_ref = research_images[0]
                 logger.info(f"  Using subject reference: {subject_ref}")
 
-            images_bytes = await self.minimax.generate_images(
-                prompt=image_prompt,
-                subject_reference_url=subject_ref,
-                num_images=2,
-                aspect_ratio="1:1"
-            )
+            # Timed inside the semaphore so queueing isn't counted
+            async with self.image_semaphore:
+                with timed(telemetry, "image_generation", day_num):
+                    images_bytes = await self.minimax.generate_images(
+                        prompt=image_prompt,
+                        subject_reference_url=subject_ref,
+                        num_images=2,
+                        aspect_ratio="1:1"
+                    )
             logger.info(f"✓ Day {day_num} generated {len(images_bytes)} images")
 
             # Task 4: Upload images to R2
             image_urls = []
-            for i, img_bytes in enumerate(images_bytes):
-                object_key = self.r2.get_campaign_path(
-                    campaign_id,
-                    f"day_{day_num}_image_{i+1}.jpg"
-                )
-
-                image_url = await self.r2.upload_bytes(
-                    data=img_bytes,
-                    object_key=object_key,
-                    content_type="image/jpeg"
-                )
-                image_urls.append(image_url)
+            with timed(telemetry, "image_upload", day_num):
+                for i, img_bytes in enumerate(images_bytes):
+                    object_key = self.r2.get_campaign_path(
+                        campaign_id,
+                        f"day_{day_num}_image_{i+1}.jpg"
+                    )
+
+                    image_url = await self.r2.upload_bytes(
+                        data=img_bytes,
+                        object_key=object_key,
+                        content_type="image/jpeg"
+                    )
+                    image_urls.append(image_url)
 
             logger.info(f"✓ Day {day_num} images uploaded to R2")
 
@@ -332,7 +549,8 @@ class CreativeAgent:
                     day_num=day_num,
                     day_plan=day_plan,
                     first_frame_image_url=image_urls[0],  # Use first image as video source
-                    business_name=business_context["business_name"]
+                    business_name=business_context["business_name"],
+                    telemetry=telemetry
                 )
 
             # Calculate recommended posting time (simple heuristic for now)
@@ -366,7 +584,8 @@ class CreativeAgent:
         day_num: int,
         day_plan: Dict[str, Any],
         first_frame_image_url: str,
-        business_name: str
+        business_name: str,
+        telemetry: Optional[List[Dict[str, Any]]] = None
     ) -> Optional[str]:
         """
         Generate video with MiniMax image-to-video
@@ -374,37 +593,43 @@ class CreativeAgent:
         Uses first generated image as video source frame
         """
         logger.info(f"Generating video for Day {day_num}")
+        if telemetry is None:
+            telemetry = []
 
         try:
             # Generate motion prompt (Gemini LOW thinking)
-            motion_prompt = await self.gemini.generate_video_motion_prompt(
-                day_plan=day_plan,
-                business_name=business_name
-            )
+            with timed(telemetry, "video_prompt", day_num):
+                motion_prompt = await self.gemini.generate_video_motion_prompt(
+                    day_plan=day_plan,
+                    business_name=business_name
+                )
             logger.info(f"✓ Video motion prompt: {motion_prompt[:50]}...")
 
             # Generate video (MiniMax image-to-video)
-            video_bytes = await self.minimax.generate_video(
-                motion_prompt=motion_prompt,
-                first_frame_image_url=first_frame_image_url,
-                duration=6
-            )
-
-            if not video_bytes:
+            async with self.video_semaphore:
+                with timed(telemetry, "video_generation", day_num):
+                    video_file_url = await self.minimax.generate_video_url(
+                        motion_prompt=motion_prompt,
+                        first_frame_image_url=first_frame_image_url,
+                        duration=6
+                    )
+
+            if not video_file_url:
                 logger.warning(f"Day {day_num} video generation failed, skipping")
                 return None
 
-            # Upload to R2
+            # Stream MiniMax → R2 so the video is never held in memory whole
             object_key = self.r2.get_campaign_path(
                 campaign_id,
                 f"day_{day_num}_video.mp4"
             )
 
-            video_url = await self.r2.upload_bytes(
-                data=video_bytes,
-                object_key=object_key,
-                content_type="video/mp4"
-            )
+            with timed(telemetry, "video_upload", day_num):
+                video_url = await self.r2.upload_stream(
+                    chunks=self.minimax.stream_video(video_file_url),
+                    object_key=object_key,
+                    content_type="video/mp4"
+                )
 
             logger.info(f"✓ Day {day_num} video uploaded to R2")
             return video_url
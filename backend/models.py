@@ -165,6 +165,7 @@ class CreativeOutput(BaseModel):
     learning_data: LearningData
     status: str = "completed"
     timestamp: datetime = Field(default_factory=datetime.now)
+    telemetry: List[Dict[str, Any]] = Field(default_factory=list)  # [{phase, day, seconds}], not stored in Convex
 
 
 # ============================================================================
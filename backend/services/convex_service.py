@@ -12,6 +12,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Arguments accepted by each Convex store mutation (see convex/*.ts). Payloads
+# are produced by a single model_dump(mode='json', include=...) so pydantic-core
+# serializes nested models, URLs and timestamps in one pass.
+_RESEARCH_ARGS = {"campaign_id", "business_context", "competitors", "market_insights", "research_images", "timestamp"}
+_ANALYTICS_ARGS = {"campaign_id", "customer_sentiment", "past_performance", "market_trends", "customer_photos", "timestamp"}
+_CONTENT_ARGS = {"campaign_id", "days", "learning_data", "status", "timestamp"}
+
 
 class ConvexService:
     """
@@ -101,6 +108,19 @@ class ConvexService:
             return CampaignProgress(**result)
         return None
 
+    async def delete_campaigns(self, campaign_ids: List[str]) -> Dict[str, Any]:
+        """Delete campaigns and their research/analytics/content in one call"""
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(
+            None,
+            lambda: self.client.mutation(
+                "campaigns:bulkDelete",
+                {"campaign_ids": campaign_ids}
+            )
+        )
+        logger.info(f"Deleted {len(campaign_ids)} campaign(s)")
+        return result
+
     # ========================================================================
     # Agent 1: Research Data Storage
     # ========================================================================
@@ -112,14 +132,7 @@ class ConvexService:
             None,
             lambda: self.client.mutation(
                 "research:store",
-                {
-                    "campaign_id": data.campaign_id,
-                    "business_context": data.business_context.model_dump(mode='json'),
-                    "competitors": [c.model_dump(mode='json') for c in data.competitors],
-                    "market_insights": data.market_insights.model_dump(mode='json'),
-                    "research_images": [str(url) for url in data.research_images],
-                    "timestamp": data.timestamp.isoformat()
-                }
+                data.model_dump(mode='json', include=_RESEARCH_ARGS)
             )
         )
         logger.info(f"Stored research for campaign: {data.campaign_id}")
@@ -151,14 +164,7 @@ class ConvexService:
             None,
             lambda: self.client.mutation(
                 "analytics:store",
-                {
-                    "campaign_id": data.campaign_id,
-                    "customer_sentiment": data.customer_sentiment.model_dump(mode='json'),
-                    "past_performance": data.past_performance.model_dump(mode='json') if data.past_performance else None,
-                    "market_trends": data.market_trends.model_dump(mode='json'),
-                    "customer_photos": [str(url) for url in data.customer_photos],
-                    "timestamp": data.timestamp.isoformat()
-                }
+                data.model_dump(mode='json', include=_ANALYTICS_ARGS)
             )
         )
         logger.info(f"Stored analytics for campaign: {data.campaign_id}")
@@ -190,13 +196,7 @@ class ConvexService:
             None,
             lambda: self.client.mutation(
                 "content:store",
-                {
-                    "campaign_id": data.campaign_id,
-                    "days": [day.model_dump(mode='json') for day in data.days],
-                    "learning_data": data.learning_data.model_dump(mode='json'),
-                    "status": data.status,
-                    "timestamp": data.timestamp.isoformat()
-                }
+                data.model_dump(mode='json', include=_CONTENT_ARGS)
             )
         )
         logger.info(f"Stored content for campaign: {data.campaign_id}")
@@ -224,14 +224,21 @@ class ConvexService:
     async def get_full_campaign_data(self, campaign_id: str) -> Dict[str, Any]:
         """
         Retrieve ALL campaign data for Agent 3 content generation.
+        Fetched with a single Convex query (campaigns:getFull) rather than
+        one round-trip per document.
         Returns: {research, analytics, progress}
         """
-        research = await self.get_research(campaign_id)
-        analytics = await self.get_analytics(campaign_id)
-        progress = await self.get_progress(campaign_id)
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(
+            None,
+            lambda: self.client.query(
+                "campaigns:getFull",
+                {"campaign_id": campaign_id}
+            )
+        )
 
         return {
-            "research": research,
-            "analytics": analytics,
-            "progress": progress
+            "research": ResearchOutput(**result["research"]) if result["research"] else None,
+            "analytics": AnalyticsOutput(**result["analytics"]) if result["analytics"] else None,
+            "progress": CampaignProgress(**result["progress"]) if result["progress"] else None
         }
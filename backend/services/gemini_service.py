@@ -1,4 +1,5 @@
 import os
+import asyncio
 from google import genai
 from google.genai import types
 from typing import Dict, List, Any, Optional
@@ -24,8 +25,23 @@ class GeminiService:
 
         self.client = genai.Client(api_key=self.api_key)
         self.model = "gemini-3-pro-preview"
+
+        # Bounds concurrent requests (e.g. the creative agent's parallel days);
+        # the default suits free-tier rate limits
+        self.semaphore = asyncio.Semaphore(int(os.getenv("GEMINI_MAX_CONCURRENT", "2")))
         logger.info("✓ Gemini 3.0 Pro initialized")
 
+    async def _generate_content(self, **kwargs) -> types.GenerateContentResponse:
+        """
+        Call generate_content through the SDK's async client.
+
+        The sync client.models call blocks the event loop for the whole
+        request, so concurrent callers ran one at a time; client.aio lets
+        them overlap, up to the service's semaphore.
+        """
+        async with self.semaphore:
+            return await self.client.aio.models.generate_content(**kwargs)
+
     # ========================================================================
     # HIGH Thinking: Strategic Analysis
     # ========================================================================
@@ -84,7 +100,7 @@ Also generate market insights:
 Make it realistic and relevant to the business industry. Output as JSON with keys: competitors, market_insights"""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -145,7 +161,7 @@ Output as JSON with these EXACT keys and formats:
 IMPORTANT: quotable_reviews must be an array of objects, NOT strings."""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -203,7 +219,7 @@ Post Performance Data:
 Output as JSON with keys: winning_patterns, avoid_patterns, recommendations"""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -291,7 +307,7 @@ Output as JSON:
 }}"""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -341,7 +357,7 @@ Max 150 words.
 Output only the caption text (no JSON, no explanation)."""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -382,7 +398,7 @@ Output: A single concise prompt (max 200 chars).
 No JSON, just the prompt text."""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -421,7 +437,7 @@ Output: A concise motion description (max 150 chars).
 No JSON, just the motion prompt."""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -2,11 +2,16 @@ import os
 import httpx
 import asyncio
 import base64
-from typing import List, Optional, Dict, Any
+import random
+from typing import AsyncIterator, List, Optional, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Rate-limit and transient server errors worth retrying; anything else
+# (e.g. 400/401/404) is a real failure and is returned immediately
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 class MiniMaxService:
     """
@@ -31,8 +36,55 @@ class MiniMaxService:
             "Content-Type": "application/json"
         }
 
+        # Retry policy for rate limits and transient errors: exponential
+        # backoff from retry_delay up to max_retry_delay, plus jitter
+        self.max_attempts = 3
+        self.retry_delay = 2  # seconds
+        self.max_retry_delay = 30  # seconds
+
         logger.info("✓ MiniMax API initialized")
 
+    async def _request_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request, retrying 429/5xx responses and network errors.
+
+        A failed generation can cost minutes of already-finished work, so
+        transient errors are retried with exponential backoff and jitter,
+        honoring Retry-After when the server sends it. The last response is
+        returned as-is once attempts run out, so callers still see the error.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = await client.request(method, url, **kwargs)
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_attempts:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("retry-after")
+            except httpx.TransportError as e:
+                if attempt == self.max_attempts:
+                    raise
+                reason = f"{type(e).__name__}: {e}"
+                retry_after = None
+
+            await self._backoff(attempt, reason, retry_after)
+
+    async def _backoff(self, attempt: int, reason: str, retry_after: Optional[str]) -> None:
+        """Sleep before the next attempt: Retry-After if given, else exponential backoff with jitter."""
+        if retry_after and retry_after.isdigit():
+            delay = min(float(retry_after), self.max_retry_delay)
+        else:
+            delay = min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay)
+        delay += random.uniform(0, 1)
+
+        logger.warning(f"⚠ MiniMax {reason} (attempt {attempt}/{self.max_attempts}), retrying in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
     # ========================================================================
     # Image Generation
     # ========================================================================
@@ -75,7 +127,9 @@ class MiniMaxService:
 
         try:
             async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
+                response = await self._request_with_retry(
+                    client,
+                    "POST",
                     self.image_url,
                     headers=self.headers,
                     json=payload
@@ -144,6 +198,44 @@ class MiniMaxService:
         Returns:
             Video bytes or None if failed
         """
+        video_file_url = await self.generate_video_url(
+            motion_prompt=motion_prompt,
+            first_frame_image_url=first_frame_image_url,
+            duration=duration
+        )
+        if not video_file_url:
+            return None
+
+        try:
+            async with httpx.AsyncClient() as client:
+                video_response = await self._request_with_retry(client, "GET", video_file_url)
+                video_response.raise_for_status()
+                return video_response.content
+
+        except Exception as e:
+            logger.error(f"✗ MiniMax video download failed: {e}")
+            return None
+
+    async def generate_video_url(
+        self,
+        motion_prompt: str,
+        first_frame_image_url: str,
+        duration: int = 6
+    ) -> Optional[str]:
+        """
+        Generate video from image with motion prompt, without downloading it.
+
+        Pair with stream_video() to move the video elsewhere (e.g. R2) in
+        chunks instead of holding the whole file in memory.
+
+        Args:
+            motion_prompt: Description of desired motion
+            first_frame_image_url: R2 URL of source image
+            duration: Video duration in seconds (default: 6)
+
+        Returns:
+            MiniMax download URL of the finished video, or None if failed
+        """
         payload = {
             "model": "video-01",
             "prompt": motion_prompt,
@@ -154,7 +246,9 @@ class MiniMaxService:
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 # Submit video generation task
-                response = await client.post(
+                response = await self._request_with_retry(
+                    client,
+                    "POST",
                     self.video_url,
                     headers=self.headers,
                     json=payload
@@ -165,19 +259,66 @@ class MiniMaxService:
                 logger.info(f"✓ MiniMax video task created: {task_id}")
 
                 # Poll for completion
-                video_bytes = await self._poll_video_task(task_id, max_wait=300)
-
-                return video_bytes
+                return await self._poll_video_task(task_id, max_wait=300)
 
         except Exception as e:
             logger.error(f"✗ MiniMax video generation failed: {e}")
             return None
 
+    async def stream_video(
+        self,
+        video_file_url: str,
+        chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Download a generated video in chunks.
+
+        429/5xx responses and network errors are retried like _request_with_retry.
+        If the download breaks after some chunks were yielded, the retry resumes
+        with a Range request; bytes already yielded are skipped if the server
+        ignores the Range header.
+
+        Args:
+            video_file_url: URL returned by generate_video_url()
+            chunk_size: Bytes per yielded chunk (default: 1MB)
+
+        Yields:
+            Video bytes, chunk by chunk
+        """
+        received = 0
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            for attempt in range(1, self.max_attempts + 1):
+                headers = {"Range": f"bytes={received}-"} if received else {}
+                try:
+                    async with client.stream("GET", video_file_url, headers=headers) as response:
+                        if response.status_code not in RETRYABLE_STATUS_CODES or attempt == self.max_attempts:
+                            response.raise_for_status()
+                            skip = received if response.status_code != 206 else 0
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                if skip:
+                                    if len(chunk) <= skip:
+                                        skip -= len(chunk)
+                                        continue
+                                    chunk = chunk[skip:]
+                                    skip = 0
+                                received += len(chunk)
+                                yield chunk
+                            return
+                        reason = f"HTTP {response.status_code}"
+                        retry_after = response.headers.get("retry-after")
+                except httpx.TransportError as e:
+                    if attempt == self.max_attempts:
+                        raise
+                    reason = f"{type(e).__name__}: {e}"
+                    retry_after = None
+
+                await self._backoff(attempt, reason, retry_after)
+
     async def _poll_video_task(
         self,
         task_id: str,
         max_wait: int = 300
-    ) -> Optional[bytes]:
+    ) -> Optional[str]:
         """
         Poll MiniMax video task until completion.
 
@@ -186,13 +327,15 @@ class MiniMaxService:
             max_wait: Maximum wait time in seconds
 
         Returns:
-            Video bytes or None
+            Download URL of the finished video, or None
         """
         waited = 0
 
         async with httpx.AsyncClient() as client:
             while waited < max_wait:
-                response = await client.get(
+                response = await self._request_with_retry(
+                    client,
+                    "GET",
                     f"{self.video_url}/tasks/{task_id}",
                     headers=self.headers
                 )
@@ -202,14 +345,8 @@ class MiniMaxService:
                 status = status_data.get("status")
 
                 if status == "completed":
-                    video_file_url = status_data.get("file_url")
-
-                    # Download video
-                    video_response = await client.get(video_file_url)
-                    video_response.raise_for_status()
-
                     logger.info(f"✓ MiniMax video completed: {task_id}")
-                    return video_response.content
+                    return status_data.get("file_url")
 
                 elif status == "failed":
                     error = status_data.get("error", "Unknown error")
@@ -1,13 +1,18 @@
 import os
 import asyncio
+import functools
 import boto3
 from botocore.client import Config
 from io import BytesIO
-from typing import Optional
+from typing import AsyncIterator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# upload_stream buffers this much before sending a multipart part; R2/S3
+# require every part except the last to be at least 5MB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class R2Service:
     """
@@ -30,7 +35,13 @@ class R2Service:
             endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
-            config=Config(signature_version="s3v4"),
+            # Standard retry mode backs off with jitter on throttling, 5xx
+            # and connection errors, so a transient failure doesn't lose an
+            # already-generated image or video
+            config=Config(
+                signature_version="s3v4",
+                retries={"max_attempts": 3, "mode": "standard"}
+            ),
             region_name="auto"
         )
 
@@ -74,6 +85,92 @@ class R2Service:
             logger.error(f"R2 upload failed: {e}")
             raise
 
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        object_key: str,
+        content_type: str = "video/mp4"
+    ) -> str:
+        """
+        Upload an async stream of bytes to R2 and return public URL.
+
+        Chunks are buffered only until a MULTIPART_PART_SIZE part is full,
+        which is sent with upload_part before reading on, so memory stays
+        bounded and nothing touches disk. Streams smaller than one part are
+        sent with a single put_object. All boto3 calls run in the executor.
+
+        Args:
+            chunks: Async iterator of file bytes
+            object_key: Path in bucket (e.g., "campaigns/xyz/day_1_video.mp4")
+            content_type: MIME type
+
+        Returns:
+            Public R2 URL
+        """
+        loop = asyncio.get_event_loop()
+
+        def run(method, **kwargs):
+            return loop.run_in_executor(
+                None,
+                functools.partial(method, Bucket=self.bucket, Key=object_key, **kwargs)
+            )
+
+        upload_id = None
+        parts = []
+        buffer = bytearray()
+
+        async def upload_part():
+            part_number = len(parts) + 1
+            response = await run(
+                self.s3_client.upload_part,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(buffer)
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            buffer.clear()
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    if upload_id is None:
+                        response = await run(
+                            self.s3_client.create_multipart_upload,
+                            ContentType=content_type
+                        )
+                        upload_id = response["UploadId"]
+                    await upload_part()
+
+            if upload_id is None:
+                await run(
+                    self.s3_client.put_object,
+                    Body=bytes(buffer),
+                    ContentType=content_type
+                )
+            else:
+                if buffer:
+                    await upload_part()
+                await run(
+                    self.s3_client.complete_multipart_upload,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts}
+                )
+
+            public_url = f"{self.public_url_base}/{object_key}"
+            logger.info(f"Uploaded to R2: {object_key}")
+            return public_url
+
+        except Exception as e:
+            logger.error(f"R2 upload failed: {e}")
+            if upload_id is not None:
+                # Don't leave orphaned parts accruing storage in the bucket
+                try:
+                    await run(self.s3_client.abort_multipart_upload, UploadId=upload_id)
+                except Exception as abort_error:
+                    logger.error(f"R2 multipart abort failed: {abort_error}")
+            raise
+
     async def upload_from_url(
         self,
         source_url: str,
@@ -10,6 +10,8 @@ This script demonstrates the photo fetching and usage flow:
 
 import asyncio
 import logging
+import os
+import orjson
 from services.google_services import GoogleServicesClient
 from agents.business_analyst import BusinessAnalystAgent
 from models import BusinessInput
@@ -21,6 +23,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared business input for the Business Analyst tests
+TEST_BUSINESS_INPUT = BusinessInput(
+    business_name="Googleplex",
+    business_address="1600 Amphitheatre Parkway, Mountain View, CA",
+    brand_voice="professional"
+)
+
+# Simulated encoded photo (shortened for demo)
+SAMPLE_ENCODED = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+
+# Static example configs shown by test_reference_image_config (do not mutate)
+VIDEO_CONFIG_WITH_REF = {
+    "numberOfVideos": 1,
+    "resolution": "720p",
+    "aspectRatio": "16:9",
+    "referenceImages": [{
+        "image": {"imageBytes": SAMPLE_ENCODED},
+        "referenceType": "STYLE"
+    }]
+}
+
+VIDEO_CONFIG_WITHOUT_REF = {
+    "numberOfVideos": 1,
+    "resolution": "720p",
+    "aspectRatio": "16:9"
+}
+
+IMAGE_CONFIG_WITH_REF = {
+    "numberOfImages": 1,
+    "aspectRatio": "1:1",
+    "referenceImages": [{
+        "image": {"imageBytes": SAMPLE_ENCODED},
+        "referenceType": "STYLE"
+    }]
+}
+
 
 async def test_photo_fetching():
     """Test photo fetching from Google Places API"""
@@ -35,7 +73,7 @@ async def test_photo_fetching():
 
     # Step 1: Get place_id
     logger.info(f"\n1. Geocoding address: {test_address}")
-    geocode_result = google_services.gmaps.geocode(test_address)
+    geocode_result = await asyncio.to_thread(google_services.gmaps.geocode, test_address)
 
     if not geocode_result:
         logger.error("Failed to geocode address")
@@ -46,7 +84,7 @@ async def test_photo_fetching():
 
     # Step 2: Fetch photos
     logger.info(f"\n2. Fetching photos for place_id: {place_id}")
-    photos = google_services.get_place_photos(place_id)
+    photos = await asyncio.to_thread(google_services.get_place_photos, place_id)
 
     if photos:
         logger.info(f"   ✓ Retrieved {len(photos)} photos")
@@ -92,25 +130,17 @@ async def test_photo_encoding(photos):
 
 
 async def test_business_analyst_integration():
-    """Test Business Analyst agent with photo fetching"""
+    """Test Business Analyst agent photo fetching (photos only, no full analysis)"""
     logger.info("\n" + "=" * 80)
     logger.info("TEST 3: Business Analyst Agent Integration")
     logger.info("=" * 80)
 
     agent = BusinessAnalystAgent()
 
-    # Create test input
-    business_input = BusinessInput(
-        business_name="Googleplex",
-        business_address="1600 Amphitheatre Parkway, Mountain View, CA",
-        brand_voice="professional"
-    )
+    logger.info(f"\n1. Fetching photos for: {TEST_BUSINESS_INPUT.business_name}")
+    logger.info(f"   Address: {TEST_BUSINESS_INPUT.business_address}")
 
-    logger.info(f"\n1. Analyzing business: {business_input.business_name}")
-    logger.info(f"   Address: {business_input.business_address}")
-
-    # Run analysis
-    profile = await agent.analyze(business_input)
+    profile = await agent.fetch_photos_only(TEST_BUSINESS_INPUT)
 
     # Check for photos in profile
     photos = profile.get('photos', [])
@@ -123,8 +153,29 @@ async def test_business_analyst_integration():
     else:
         logger.warning("\n2. ⚠ No photos in business profile")
 
+    return profile
+
+
+async def test_business_analyst_full_analysis():
+    """
+    Test full Business Analyst analysis (Gemini + Maps + trends + photos).
+
+    Slow: only runs when RUN_SLOW_TESTS=1 is set.
+    """
+    logger.info("\n" + "=" * 80)
+    logger.info("TEST 3b: Business Analyst Full Analysis (slow)")
+    logger.info("=" * 80)
+
+    agent = BusinessAnalystAgent()
+
+    logger.info(f"\n1. Analyzing business: {TEST_BUSINESS_INPUT.business_name}")
+    logger.info(f"   Address: {TEST_BUSINESS_INPUT.business_address}")
+
+    # Run analysis
+    profile = await agent.analyze(TEST_BUSINESS_INPUT)
+
     # Show full profile structure
-    logger.info(f"\n3. Business profile structure:")
+    logger.info(f"\n2. Business profile structure:")
     logger.info(f"   - business_name: {profile.get('business_name')}")
     logger.info(f"   - from_maps: {bool(profile.get('from_maps'))}")
     logger.info(f"   - photos: {len(profile.get('photos', []))} items")
@@ -139,39 +190,14 @@ async def test_reference_image_config():
     logger.info("TEST 4: Reference Image Configuration")
     logger.info("=" * 80)
 
-    # Simulate encoded photo (shortened for demo)
-    sample_encoded = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
-
     logger.info("\n1. Video generation config WITH reference image:")
-    video_config_with_ref = {
-        "numberOfVideos": 1,
-        "resolution": "720p",
-        "aspectRatio": "16:9",
-        "referenceImages": [{
-            "image": {"imageBytes": sample_encoded},
-            "referenceType": "STYLE"
-        }]
-    }
-    logger.info(f"   {video_config_with_ref}")
+    logger.info("   %s", orjson.dumps(VIDEO_CONFIG_WITH_REF, option=orjson.OPT_INDENT_2).decode())
 
     logger.info("\n2. Video generation config WITHOUT reference image:")
-    video_config_without_ref = {
-        "numberOfVideos": 1,
-        "resolution": "720p",
-        "aspectRatio": "16:9"
-    }
-    logger.info(f"   {video_config_without_ref}")
+    logger.info("   %s", orjson.dumps(VIDEO_CONFIG_WITHOUT_REF, option=orjson.OPT_INDENT_2).decode())
 
     logger.info("\n3. Image generation config WITH reference image:")
-    image_config_with_ref = {
-        "numberOfImages": 1,
-        "aspectRatio": "1:1",
-        "referenceImages": [{
-            "image": {"imageBytes": sample_encoded},
-            "referenceType": "STYLE"
-        }]
-    }
-    logger.info(f"   {image_config_with_ref}")
+    logger.info("   %s", orjson.dumps(IMAGE_CONFIG_WITH_REF, option=orjson.OPT_INDENT_2).decode())
 
     logger.info("\n4. Reference types available:")
     logger.info("   - STYLE: Applies visual style from reference (colors, lighting, mood)")
@@ -193,9 +219,15 @@ async def run_all_tests():
         if photos:
             await test_photo_encoding(photos)
 
-        # Test 3: Business Analyst integration
+        # Test 3: Business Analyst integration (photos only)
         await test_business_analyst_integration()
 
+        # Test 3b: Full Business Analyst analysis (slow, opt-in)
+        if os.getenv("RUN_SLOW_TESTS") == "1":
+            await test_business_analyst_full_analysis()
+        else:
+            logger.info("\nSkipping full Business Analyst analysis (set RUN_SLOW_TESTS=1 to run)")
+
         # Test 4: Reference config demo
         await test_reference_image_config()
 
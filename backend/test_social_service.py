@@ -1,10 +1,11 @@
 import pytest
 import asyncio
-from services.social_service import SocialService
 
 @pytest.mark.asyncio
 async def test_social_initialization():
     """Test Social service initialization"""
+    from services.social_service import SocialService
+
     service = SocialService()
     print("✓ Social Service initialized")
 
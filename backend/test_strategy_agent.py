@@ -1,15 +1,16 @@
 import pytest
 import asyncio
-from agents.strategy_agent import StrategyAgent
-from services.gemini_service import GeminiService
-from services.social_service import SocialService
-from services.convex_service import ConvexService
-from services.r2_service import R2Service
-from services.agi_service import AGIService
 
 @pytest.mark.asyncio
 async def test_strategy_agent_initialization():
     """Test Strategy Agent initialization"""
+    from agents.strategy_agent import StrategyAgent
+    from services.gemini_service import GeminiService
+    from services.social_service import SocialService
+    from services.convex_service import ConvexService
+    from services.r2_service import R2Service
+    from services.agi_service import AGIService
+
     gemini = GeminiService()
     social = SocialService()
     convex = ConvexService()
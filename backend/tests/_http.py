@@ -0,0 +1,24 @@
+"""
+Shared HTTP client factory for the MiniMax debug scripts.
+
+One pooled client per origin keeps TLS connections alive across requests
+and lets concurrent requests multiplex over HTTP/2.
+"""
+from contextlib import asynccontextmanager
+
+import httpx
+
+MINIMAX_BASE_URL = "https://api.minimax.chat"
+
+
+@asynccontextmanager
+async def minimax_client(timeout: float = 120.0):
+    """Yield a pooled httpx.AsyncClient bound to the MiniMax API origin"""
+    async with httpx.AsyncClient(
+        base_url=MINIMAX_BASE_URL,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=5, max_connections=10, keepalive_expiry=30.0),
+        http2=True,
+        headers={"Content-Type": "application/json"},
+    ) as client:
+        yield client
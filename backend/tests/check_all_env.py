@@ -17,30 +17,33 @@ BLUE = "\033[94m"
 RESET = "\033[0m"
 
 
-def check_env_var(name: str, required: bool = True) -> bool:
-    """Check if environment variable is set"""
+def check_env_var(out: list, name: str, required: bool = True) -> bool:
+    """Check if environment variable is set, appending its status line to out"""
     value = os.getenv(name)
 
     if value:
         # Mask sensitive values
         if "KEY" in name or "TOKEN" in name or "SECRET" in name:
             masked = value[:8] + "..." if len(value) > 8 else "***"
-            print(f"{GREEN}✓{RESET} {name}: {masked}")
+            out.append(f"{GREEN}✓{RESET} {name}: {masked}")
         else:
-            print(f"{GREEN}✓{RESET} {name}: {value}")
+            out.append(f"{GREEN}✓{RESET} {name}: {value}")
         return True
     else:
         if required:
-            print(f"{RED}✗{RESET} {name}: NOT SET (REQUIRED)")
+            out.append(f"{RED}✗{RESET} {name}: NOT SET (REQUIRED)")
         else:
-            print(f"{YELLOW}⚠{RESET} {name}: NOT SET (OPTIONAL)")
+            out.append(f"{YELLOW}⚠{RESET} {name}: NOT SET (OPTIONAL)")
         return not required
 
 
 def main():
-    print("\n" + "=" * 80)
-    print("ENVIRONMENT VARIABLES CHECK")
-    print("=" * 80)
+    # Collect output and write it in one go instead of line-by-line
+    out = []
+
+    out.append("\n" + "=" * 80)
+    out.append("ENVIRONMENT VARIABLES CHECK")
+    out.append("=" * 80)
 
     # Track overall status
     all_required_set = True
@@ -49,8 +52,8 @@ def main():
     # Core Services (REQUIRED)
     # ========================================================================
 
-    print(f"\n{BLUE}Core Services (REQUIRED){RESET}")
-    print("-" * 80)
+    out.append(f"\n{BLUE}Core Services (REQUIRED){RESET}")
+    out.append("-" * 80)
 
     required_vars = [
         "CONVEX_URL",
@@ -60,15 +63,15 @@ def main():
     ]
 
     for var in required_vars:
-        if not check_env_var(var, required=True):
+        if not check_env_var(out, var, required=True):
             all_required_set = False
 
     # ========================================================================
     # Storage Services (REQUIRED)
     # ========================================================================
 
-    print(f"\n{BLUE}Storage Services (REQUIRED){RESET}")
-    print("-" * 80)
+    out.append(f"\n{BLUE}Storage Services (REQUIRED){RESET}")
+    out.append("-" * 80)
 
     storage_vars = [
         "R2_ACCOUNT_ID",
@@ -78,16 +81,16 @@ def main():
     ]
 
     for var in storage_vars:
-        if not check_env_var(var, required=True):
+        if not check_env_var(out, var, required=True):
             all_required_set = False
 
     # ========================================================================
     # Social Services (OPTIONAL - Agent 2 features)
     # ========================================================================
 
-    print(f"\n{BLUE}Social Services (OPTIONAL){RESET}")
-    print("-" * 80)
-    print("Note: Required for full Agent 2 performance analytics")
+    out.append(f"\n{BLUE}Social Services (OPTIONAL){RESET}")
+    out.append("-" * 80)
+    out.append("Note: Required for full Agent 2 performance analytics")
 
     optional_vars = [
         "FACEBOOK_PAGE_ID",
@@ -97,20 +100,20 @@ def main():
 
     social_complete = True
     for var in optional_vars:
-        if not check_env_var(var, required=False):
+        if not check_env_var(out, var, required=False):
             social_complete = False
 
     if social_complete:
-        print(f"\n{GREEN}✓ Social services fully configured{RESET}")
+        out.append(f"\n{GREEN}✓ Social services fully configured{RESET}")
     else:
-        print(f"\n{YELLOW}⚠ Social services partially configured - Agent 2 will skip performance analytics{RESET}")
+        out.append(f"\n{YELLOW}⚠ Social services partially configured - Agent 2 will skip performance analytics{RESET}")
 
     # ========================================================================
     # Other Optional Services
     # ========================================================================
 
-    print(f"\n{BLUE}Other Services (OPTIONAL){RESET}")
-    print("-" * 80)
+    out.append(f"\n{BLUE}Other Services (OPTIONAL){RESET}")
+    out.append("-" * 80)
 
     other_optional = [
         "GOOGLE_PLACES_API_KEY",  # For review fetching
@@ -120,31 +123,34 @@ def main():
     ]
 
     for var in other_optional:
-        check_env_var(var, required=False)
+        check_env_var(out, var, required=False)
 
     # ========================================================================
     # Summary
     # ========================================================================
 
-    print("\n" + "=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
+    out.append("\n" + "=" * 80)
+    out.append("SUMMARY")
+    out.append("=" * 80)
 
     if all_required_set:
-        print(f"{GREEN}✓ All required environment variables are set{RESET}")
-        print(f"\n{GREEN}You can run orchestrator tests!{RESET}")
-        print("\nRun tests:")
-        print("  cd backend/tests")
-        print("  python test_orchestrator.py")
-        return 0
+        out.append(f"{GREEN}✓ All required environment variables are set{RESET}")
+        out.append(f"\n{GREEN}You can run orchestrator tests!{RESET}")
+        out.append("\nRun tests:")
+        out.append("  cd backend/tests")
+        out.append("  python test_orchestrator.py")
+        status = 0
     else:
-        print(f"{RED}✗ Some required environment variables are missing{RESET}")
-        print(f"\n{RED}Cannot run orchestrator tests until all required variables are set{RESET}")
-        print("\nSet missing variables:")
-        print("  export VARIABLE_NAME=value")
-        print("\nOr add to .env file:")
-        print("  echo 'VARIABLE_NAME=value' >> .env")
-        return 1
+        out.append(f"{RED}✗ Some required environment variables are missing{RESET}")
+        out.append(f"\n{RED}Cannot run orchestrator tests until all required variables are set{RESET}")
+        out.append("\nSet missing variables:")
+        out.append("  export VARIABLE_NAME=value")
+        out.append("\nOr add to .env file:")
+        out.append("  echo 'VARIABLE_NAME=value' >> .env")
+        status = 1
+
+    sys.stdout.write("\n".join(out) + "\n")
+    return status
 
 
 if __name__ == "__main__":
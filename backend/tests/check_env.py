@@ -45,10 +45,18 @@ optional = {
 missing_critical = []
 missing_optional = []
 
+# Read each variable once; later checks and alias hints reuse these values
+env = {key: os.getenv(key) for key in (
+    *critical,
+    *optional,
+    "VITE_CONVEX_URL",
+    "R2_BUCKET_NAME",
+)}
+
 print("CRITICAL APIs (required for tests):")
 print("-" * 70)
 for key, description in critical.items():
-    present = bool(os.getenv(key))
+    present = bool(env.get(key))
     status = "✓" if present else "✗"
     print(f"  {status} {key:30s} {description}")
     if not present:
@@ -58,7 +66,7 @@ print()
 print("OPTIONAL APIs (graceful degradation):")
 print("-" * 70)
 for key, description in optional.items():
-    present = bool(os.getenv(key))
+    present = bool(env.get(key))
     status = "✓" if present else "○"
     print(f"  {status} {key:30s} {description}")
     if not present:
@@ -74,12 +82,12 @@ aliases = [
 ]
 
 for expected, alternative in aliases:
-    has_expected = bool(os.getenv(expected))
-    has_alternative = bool(os.getenv(alternative))
+    expected_value = env.get(expected)
+    alternative_value = env.get(alternative)
 
-    if not has_expected and has_alternative:
+    if not expected_value and alternative_value:
         print(f"  ⚠ Found {alternative} but tests expect {expected}")
-        print(f"    Add this to .env: {expected}={os.getenv(alternative)}")
+        print(f"    Add this to .env: {expected}={alternative_value}")
 print()
 
 # Summary
@@ -97,17 +105,17 @@ else:
     print("ACTION REQUIRED:")
 
     # Check for aliases
-    if not os.getenv("CONVEX_URL") and os.getenv("VITE_CONVEX_URL"):
-        print(f"  1. Add to .env: CONVEX_URL={os.getenv('VITE_CONVEX_URL')}")
+    if not env["CONVEX_URL"] and env["VITE_CONVEX_URL"]:
+        print(f"  1. Add to .env: CONVEX_URL={env['VITE_CONVEX_URL']}")
 
-    if not os.getenv("R2_BUCKET") and os.getenv("R2_BUCKET_NAME"):
-        print(f"  2. Add to .env: R2_BUCKET={os.getenv('R2_BUCKET_NAME')}")
+    if not env["R2_BUCKET"] and env["R2_BUCKET_NAME"]:
+        print(f"  2. Add to .env: R2_BUCKET={env['R2_BUCKET_NAME']}")
 
-    if not os.getenv("GEMINI_API_KEY"):
+    if not env["GEMINI_API_KEY"]:
         print("  3. Get GEMINI_API_KEY from: https://aistudio.google.com/app/apikey")
         print("     Add to .env: GEMINI_API_KEY=your-key-here")
 
-    if not os.getenv("CLOUDFLARE_ACCOUNT_ID"):
+    if not env["CLOUDFLARE_ACCOUNT_ID"]:
         print("  4. Get CLOUDFLARE_ACCOUNT_ID from: https://dash.cloudflare.com/")
         print("     Add to .env: CLOUDFLARE_ACCOUNT_ID=your-account-id")
 
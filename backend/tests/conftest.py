@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the backend test suite
+
+pytest imports this module once per session, so the backend .env is parsed
+a single time no matter how many test modules are collected.
+"""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent.parent / ".env")
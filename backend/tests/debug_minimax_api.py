@@ -4,30 +4,50 @@ Debug script to test MiniMax API directly and see actual response format
 """
 import asyncio
 import os
+import sys
 import json
+import traceback
 import httpx
+import orjson
 from pathlib import Path
 from dotenv import load_dotenv
 
+from _http import MINIMAX_BASE_URL, minimax_client
+
 # Load environment
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-async def test_minimax_api():
-    """Test MiniMax API with minimal payload"""
+# Bytes of the response body to read when previewing
+HEAD_BYTES = 4096
+
+# Possible image field names in a MiniMax response item
+_POSSIBLE_IMAGE_FIELDS = ('base64_image', 'image', 'url', 'image_url', 'b64_json')
+
+async def alog(*args):
+    """print() on a worker thread so slow stdout doesn't stall the event loop"""
+    await asyncio.to_thread(print, *args)
+
+
+async def test_minimax_api(full: bool = False):
+    """
+    Test MiniMax API with minimal payload.
+
+    By default only the head of the response body is read and printed;
+    pass full=True (--full) to download and analyze the whole response.
+    """
 
     api_key = os.getenv("MINIMAX_API_KEY")
     if not api_key:
-        print("❌ MINIMAX_API_KEY not set")
+        await alog("❌ MINIMAX_API_KEY not set")
         return
 
-    print(f"✓ API Key loaded (length: {len(api_key)})")
+    await alog(f"✓ API Key loaded (length: {len(api_key)})")
 
     # Test endpoint
-    url = "https://api.minimax.chat/v1/image_generation"
+    url = "/v1/image_generation"
 
     headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
+        "Authorization": f"Bearer {api_key}"
     }
 
     payload = {
@@ -37,61 +57,74 @@ async def test_minimax_api():
         "num_images": 1
     }
 
-    print(f"\n📤 Request:")
-    print(f"URL: {url}")
-    print(f"Payload: {json.dumps(payload, indent=2)}")
+    await alog("\n📤 Request:")
+    await alog(f"URL: {MINIMAX_BASE_URL}{url}")
+    await alog(f"Payload: {json.dumps(payload, indent=2)}")
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            print(f"\n⏳ Sending request...")
-            response = await client.post(url, headers=headers, json=payload)
-
-            print(f"\n📥 Response Status: {response.status_code}")
-            print(f"Response Headers: {dict(response.headers)}")
-
-            if response.status_code != 200:
-                print(f"\n❌ Error Response:")
-                print(response.text)
+        async with minimax_client(timeout=120.0) as client:
+            await alog("\n⏳ Sending request...")
+            async with client.stream("POST", url, headers=headers, json=payload) as response:
+                await alog(f"\n📥 Response Status: {response.status_code}")
+                await alog(f"Response Headers: {dict(response.headers)}")
+
+                if response.status_code != 200:
+                    await response.aread()
+                    await alog("\n❌ Error Response:")
+                    await alog(response.text)
+                    return
+
+                if full:
+                    body = await response.aread()
+                    head = body[:HEAD_BYTES]
+                else:
+                    # Only pull enough of the (possibly multi-MB) body to preview it
+                    head = b""
+                    async for chunk in response.aiter_bytes():
+                        head += chunk
+                        if len(head) >= HEAD_BYTES:
+                            break
+
+            await alog("\n✓ Response body (first 1000 bytes):")
+            await alog(head[:1000].decode("utf-8", errors="replace"))
+
+            if not full:
+                await alog("\nℹ️  Run with --full to parse the whole response and analyze its structure")
                 return
 
-            result = response.json()
-            print(f"\n✓ Response JSON:")
-            print(json.dumps(result, indent=2)[:1000])  # First 1000 chars
+            result = orjson.loads(body)
 
             # Check response structure
-            print(f"\n🔍 Response Structure Analysis:")
-            print(f"  - Top-level keys: {list(result.keys())}")
+            await alog("\n🔍 Response Structure Analysis:")
+            await alog(f"  - Top-level keys: {list(result.keys())}")
 
             if "data" in result:
-                print(f"  - data type: {type(result['data'])}")
-                print(f"  - data length: {len(result['data']) if isinstance(result['data'], list) else 'N/A'}")
+                await alog(f"  - data type: {type(result['data'])}")
+                await alog(f"  - data length: {len(result['data']) if isinstance(result['data'], list) else 'N/A'}")
 
                 if isinstance(result['data'], list) and len(result['data']) > 0:
-                    print(f"  - First item keys: {list(result['data'][0].keys())}")
+                    await alog(f"  - First item keys: {list(result['data'][0].keys())}")
 
                     # Check for different possible image field names
                     first_item = result['data'][0]
-                    possible_image_fields = ['base64_image', 'image', 'url', 'image_url', 'b64_json']
-
-                    print(f"\n  Checking for image data fields:")
-                    for field in possible_image_fields:
+                    await alog("\n  Checking for image data fields:")
+                    for field in _POSSIBLE_IMAGE_FIELDS:
                         if field in first_item:
                             value = first_item[field]
-                            print(f"    ✓ Found '{field}' (type: {type(value)}, length: {len(str(value)) if value else 0})")
+                            await alog(f"    ✓ Found '{field}' (type: {type(value)}, length: {len(str(value)) if value else 0})")
                         else:
-                            print(f"    ✗ '{field}' not found")
+                            await alog(f"    ✗ '{field}' not found")
 
             if "error" in result:
-                print(f"\n❌ API returned error:")
-                print(json.dumps(result['error'], indent=2))
+                await alog("\n❌ API returned error:")
+                await alog(json.dumps(result['error'], indent=2))
 
     except httpx.HTTPStatusError as e:
-        print(f"\n❌ HTTP Error: {e}")
-        print(f"Response: {e.response.text}")
+        await alog(f"\n❌ HTTP Error: {e}")
+        await alog(f"Response: {e.response.text}")
     except Exception as e:
-        print(f"\n❌ Exception: {e}")
-        import traceback
-        traceback.print_exc()
+        await alog(f"\n❌ Exception: {e}")
+        await asyncio.to_thread(sys.stderr.write, traceback.format_exc())
 
 if __name__ == "__main__":
-    asyncio.run(test_minimax_api())
+    asyncio.run(test_minimax_api(full="--full" in sys.argv))
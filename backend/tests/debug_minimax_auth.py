@@ -3,157 +3,184 @@
 Debug script to test different MiniMax authentication methods
 """
 import asyncio
+import base64
+import functools
+import io
 import os
 import json
 import httpx
 from pathlib import Path
 from dotenv import load_dotenv
 
+from _http import minimax_client
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-async def test_auth_methods():
-    """Test different authentication methods"""
+IMAGE_GENERATION_PATH = "/v1/image_generation"
+# Characters of the raw response body logged before JSON parsing
+RAW_PREVIEW_CHARS = 300
 
-    api_key = os.getenv("MINIMAX_API_KEY")
-    if not api_key:
-        print("❌ MINIMAX_API_KEY not set")
-        return
+PAYLOAD = {
+    "model": "image-01",
+    "prompt": "A red apple",
+    "num_images": 1
+}
 
-    print(f"✓ API Key loaded (length: {len(api_key)})")
-    print(f"First 50 chars: {api_key[:50]}...")
-    print(f"Last 10 chars: ...{api_key[-10:]}")
 
-    url = "https://api.minimax.chat/v1/image_generation"
-    payload = {
-        "model": "image-01",
-        "prompt": "A red apple",
-        "num_images": 1
-    }
+async def alog(*args):
+    """print() on a worker thread so slow stdout doesn't stall the event loop"""
+    await asyncio.to_thread(print, *args)
 
-    # Method 1: Bearer token (current method)
-    print(f"\n{'='*60}")
-    print("Method 1: Bearer Authorization Header")
-    print(f"{'='*60}")
 
+async def _post(client: httpx.AsyncClient, label: str, **kwargs):
+    """POST to the image endpoint, returning (label, status, body) or (label, None, error)"""
     try:
-        headers_bearer = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
+        response = await client.post(IMAGE_GENERATION_PATH, **kwargs)
+        # Log the raw reply first so a non-JSON error page is still visible
+        await alog(f"{label}: HTTP {response.status_code} {response.text[:RAW_PREVIEW_CHARS]}")
+        return label, response.status_code, response.json()
+    except Exception as e:
+        return label, None, e
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers_bearer, json=payload)
-            print(f"Status: {response.status_code}")
-            result = response.json()
-            print(f"Response: {json.dumps(result, indent=2)[:500]}")
 
-    except Exception as e:
-        print(f"Error: {e}")
+async def probe_bearer(client: httpx.AsyncClient, api_key: str):
+    """Method 1: Bearer token (current method)"""
+    headers_bearer = {
+        "Authorization": f"Bearer {api_key}"
+    }
+    return await _post(client, "Method 1: Bearer Authorization Header",
+                       headers=headers_bearer, json=PAYLOAD)
 
-    # Method 2: Authorization without Bearer prefix
-    print(f"\n{'='*60}")
-    print("Method 2: Authorization Header (no Bearer)")
-    print(f"{'='*60}")
 
-    try:
-        headers_plain = {
-            "Authorization": api_key,
-            "Content-Type": "application/json"
-        }
+async def probe_plain(client: httpx.AsyncClient, api_key: str):
+    """Method 2: Authorization without Bearer prefix"""
+    headers_plain = {
+        "Authorization": api_key
+    }
+    return await _post(client, "Method 2: Authorization Header (no Bearer)",
+                       headers=headers_plain, json=PAYLOAD)
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers_plain, json=payload)
-            print(f"Status: {response.status_code}")
-            result = response.json()
-            print(f"Response: {json.dumps(result, indent=2)[:500]}")
 
-    except Exception as e:
-        print(f"Error: {e}")
+async def probe_xapi(client: httpx.AsyncClient, api_key: str):
+    """Method 3: X-API-Key header"""
+    headers_xapi = {
+        "X-API-Key": api_key
+    }
+    return await _post(client, "Method 3: X-API-Key Header",
+                       headers=headers_xapi, json=PAYLOAD)
 
-    # Method 3: X-API-Key header
-    print(f"\n{'='*60}")
-    print("Method 3: X-API-Key Header")
-    print(f"{'='*60}")
 
-    try:
-        headers_xapi = {
-            "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        }
+async def probe_query(client: httpx.AsyncClient, api_key: str):
+    """Method 4: Query parameter"""
+    return await _post(client, "Method 4: Query Parameter",
+                       params={"api_key": api_key}, json=PAYLOAD)
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers_xapi, json=payload)
-            print(f"Status: {response.status_code}")
-            result = response.json()
-            print(f"Response: {json.dumps(result, indent=2)[:500]}")
 
-    except Exception as e:
-        print(f"Error: {e}")
+async def probe_group(client: httpx.AsyncClient, api_key: str, group_id):
+    """Method 5: Bearer with GroupID in payload"""
+    payload_with_group = {
+        **PAYLOAD,
+        "group_id": group_id
+    }
+    headers_bearer = {
+        "Authorization": f"Bearer {api_key}"
+    }
+    return await _post(client, "Method 5: Bearer with GroupID in payload",
+                       headers=headers_bearer, json=payload_with_group)
+
 
-    # Method 4: Query parameter
-    print(f"\n{'='*60}")
-    print("Method 4: Query Parameter")
-    print(f"{'='*60}")
+def json_head(obj, n: int = 500) -> str:
+    """
+    Return the first n characters of obj pretty-printed as JSON.
 
+    Encodes incrementally and stops once n characters are produced, so a
+    multi-MB response costs O(n) rather than a full serialization.
+    """
+    buf = io.StringIO()
     try:
-        url_with_key = f"{url}?api_key={api_key}"
-        headers_basic = {
-            "Content-Type": "application/json"
-        }
+        for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(obj):
+            buf.write(chunk)
+            if buf.tell() >= n:
+                break
+    except Exception:
+        return repr(obj)[:n]
+    return buf.getvalue()[:n]
+
+
+@functools.lru_cache(maxsize=1)
+def decode_jwt_payload_unverified(token: str) -> dict:
+    """
+    Decode the claims of a JWT without verifying its signature.
+
+    Safe here because the token is only read for its GroupID and is then
+    sent to MiniMax, which does the real verification.
+    """
+    payload_part = token.split('.')[1]
+    # Restore base64 padding stripped by JWT encoding
+    payload_part += "=" * (-len(payload_part) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload_part))
+
+
+async def extract_group_id(api_key: str):
+    """Try to extract GroupID from the JWT payload, printing what was decoded"""
+    if len(api_key.split('.')) < 2:
+        return None
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url_with_key, headers=headers_basic, json=payload)
-            print(f"Status: {response.status_code}")
-            result = response.json()
-            print(f"Response: {json.dumps(result, indent=2)[:500]}")
+    try:
+        jwt_payload = decode_jwt_payload_unverified(api_key)
+        await alog(f"JWT Payload: {json.dumps(jwt_payload, indent=2)}")
+
+        group_id = jwt_payload.get('GroupID')
+        await alog(f"\nExtracted GroupID: {group_id}")
+        return group_id
 
     except Exception as e:
-        print(f"Error: {e}")
+        await alog(f"Error decoding JWT: {e}")
+        return None
 
-    # Method 5: Check if group_id or other fields are needed
-    print(f"\n{'='*60}")
-    print("Method 5: Bearer with GroupID in payload")
-    print(f"{'='*60}")
 
-    try:
-        # Try to extract group_id from JWT
-        import base64
-        jwt_parts = api_key.split('.')
-        if len(jwt_parts) >= 2:
-            # Decode JWT payload (add padding if needed)
-            payload_part = jwt_parts[1]
-            padding = 4 - len(payload_part) % 4
-            if padding != 4:
-                payload_part += '=' * padding
-
-            decoded = base64.b64decode(payload_part)
-            jwt_payload = json.loads(decoded)
-            print(f"JWT Payload: {json.dumps(jwt_payload, indent=2)}")
-
-            group_id = jwt_payload.get('GroupID')
-            print(f"\nExtracted GroupID: {group_id}")
-
-            # Try with group_id
-            payload_with_group = {
-                "model": "image-01",
-                "prompt": "A red apple",
-                "num_images": 1,
-                "group_id": group_id
-            }
-
-            headers_bearer = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            }
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, headers=headers_bearer, json=payload_with_group)
-                print(f"\nStatus: {response.status_code}")
-                result = response.json()
-                print(f"Response: {json.dumps(result, indent=2)[:500]}")
+async def test_auth_methods():
+    """Test different authentication methods"""
 
-    except Exception as e:
-        print(f"Error: {e}")
+    api_key = os.getenv("MINIMAX_API_KEY")
+    if not api_key:
+        await alog("❌ MINIMAX_API_KEY not set")
+        return
+
+    await alog(f"✓ API Key loaded (length: {len(api_key)})")
+    await alog(f"First 50 chars: {api_key[:50]}...")
+    await alog(f"Last 10 chars: ...{api_key[-10:]}")
+
+    # Method 5 needs the GroupID from the key, so decode it up front
+    group_id = await extract_group_id(api_key)
+
+    # One pooled client for every method so the TLS connection is reused and
+    # the concurrent probes multiplex over HTTP/2
+    async with minimax_client(timeout=60.0) as client:
+        probes = [
+            probe_bearer(client, api_key),
+            probe_plain(client, api_key),
+            probe_xapi(client, api_key),
+            probe_query(client, api_key),
+        ]
+        if group_id is not None:
+            probes.append(probe_group(client, api_key, group_id))
+
+        # Probes are independent; each catches its own errors so one failure
+        # cannot cancel the others
+        results = await asyncio.gather(*probes)
+
+    for label, status, body in results:
+        await alog(f"\n{'='*60}")
+        await alog(label)
+        await alog(f"{'='*60}")
+
+        if status is None:
+            await alog(f"Error: {body}")
+            continue
+
+        await alog(f"Status: {status}")
+        await alog(f"Response: {json_head(body, 500)}")
 
 if __name__ == "__main__":
     asyncio.run(test_auth_methods())
@@ -11,13 +11,14 @@ Tests cover:
 All outputs are saved to backend/tests/outputs/agi/ for manual inspection.
 """
 import asyncio
+import random
 import sys
+import time
 import os
 
 # Load environment variables
-import json
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,6 +28,8 @@ from dotenv import load_dotenv
 from pathlib import Path
 load_dotenv(Path(__file__).parent.parent / ".env")
 
+import orjson
+
 
 
 
@@ -39,6 +42,53 @@ TEST_BUSINESS_URL = "https://www.bluebottlecoffee.com"
 TEST_BUSINESS_NAME = "Blue Bottle Coffee"
 TEST_LOCATION = {"city": "San Francisco", "state": "CA", "country": "USA"}
 
+# Fetch sizes kept small by default: the tests only check structure and the
+# first few items. Bump these locally for fuller output.
+NUM_COMPETITORS = int(os.getenv("AGI_TEST_NUM_COMPETITORS", "1"))
+REVIEW_LIMIT = int(os.getenv("AGI_TEST_REVIEW_LIMIT", "5"))
+
+# Keys each AGI response must contain
+_BUSINESS_CONTEXT_REQUIRED = frozenset(("business_name", "industry", "description"))
+_REVIEWS_REQUIRED = frozenset(("reviews", "overall_rating", "total_reviews", "sources"))
+
+# Per-call deadlines (seconds), set a little above observed p95 so a hung
+# AGI backend turns into a skip instead of stalling the suite
+AGI_DEADLINES = {
+    "extract_business_context": 180,
+    "discover_competitors": 240,
+    "scrape_online_reviews": 240,
+    "research_competitor": 240,
+}
+
+# AGIService catches its own upstream errors (HTTP 429/5xx, network errors)
+# and returns empty fallback data instead of raising, so a transient failure
+# is only visible in the result. These predicates spot each method's fallback
+DEGRADED_RESULT_CHECKS = {
+    "extract_business_context": lambda result: not result or not result.get("business_name"),
+    "discover_competitors": lambda result: not result,
+    # A successful scrape always reports at least the "AGI Scraped" source
+    "scrape_online_reviews": lambda result: not result.get("sources"),
+    "research_competitor": lambda result: not result,
+}
+
+# In-memory handoff between dependent tests (business context -> competitors
+# -> competitor research), so later tests don't re-read JSON from disk
+shared_state: Dict[str, Any] = {}
+
+# Background JSON saves, awaited before main() lists the output files
+_pending_saves: List[asyncio.Task] = []
+
+# Shared AGIService instance, created on first use
+_agi_service_singleton: Optional[AGIService] = None
+
+
+def get_agi_service() -> AGIService:
+    """Return the shared AGIService, creating it on first call"""
+    global _agi_service_singleton
+    if _agi_service_singleton is None:
+        _agi_service_singleton = AGIService()
+    return _agi_service_singleton
+
 
 class TestResult:
     """Track test results for summary"""
@@ -87,16 +137,154 @@ class TestResult:
 def save_json_output(filename: str, data: Any):
     """Save JSON data to output directory"""
     filepath = OUTPUT_DIR / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"   💾 Saved to: {filepath}")
 
 
-def validate_json_structure(data: Dict, required_keys: List[str], test_name: str) -> bool:
+def save_json_output_in_background(filename: str, data: Any):
+    """Save JSON output on a worker thread without blocking the running test"""
+    _pending_saves.append(
+        asyncio.create_task(asyncio.to_thread(save_json_output, filename, data))
+    )
+
+
+class DegradedResult(Exception):
+    """Raised when AGIService returned its empty fallback instead of real data"""
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Timeouts and empty fallback results are worth retrying.
+
+    AGIService never lets httpx errors escape, so these are the only
+    upstream failures a caller can observe.
+    """
+    return isinstance(error, (asyncio.TimeoutError, DegradedResult))
+
+
+async def with_retry(
+    coro_factory,
+    is_degraded=None,
+    attempts: int = 3,
+    base: float = 2.0,
+    cap: float = 20.0
+):
+    """
+    Await coro_factory() with bounded retries on transient errors.
+
+    Uses exponential backoff with jitter between attempts. Auth and
+    validation errors (anything else) are raised immediately. A result
+    for which is_degraded(result) is true is retried like a transient error,
+    and raises DegradedResult once attempts run out.
+    """
+    for attempt in range(attempts):
+        try:
+            result = await coro_factory()
+            if is_degraded is not None and is_degraded(result):
+                raise DegradedResult("AGI service returned empty fallback data")
+            return result
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_transient(e):
+                raise
+            delay = min(cap, base * 2 ** attempt) * (0.5 + random.random() * 0.5)
+            print(f"   🔁 Transient error ({type(e).__name__}), retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+
+class BreakerOpen(Exception):
+    """Raised when the AGI circuit breaker is open and calls should fail fast"""
+
+
+class Breaker:
+    """
+    Minimal circuit breaker (CLOSED -> OPEN -> HALF_OPEN).
+
+    Opens after fail_threshold consecutive transient failures; once open,
+    calls fail fast with BreakerOpen until reset_after seconds have passed.
+    The first caller after that is let through as a trial (HALF_OPEN) while
+    every other caller keeps failing fast until the trial reports back via
+    on_success, on_failure or release.
+    """
+
+    def __init__(self, fail_threshold: int = 2, reset_after: float = 60.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self.fails = 0
+        self.opened_at: Optional[float] = None
+        self.half_open = False
+
+    def before(self):
+        if self.opened_at is None:
+            return
+        if self.half_open or time.monotonic() - self.opened_at < self.reset_after:
+            raise BreakerOpen(f"AGI breaker open after {self.fails} consecutive failures")
+        self.half_open = True
+
+    def on_success(self):
+        self.fails = 0
+        self.opened_at = None
+        self.half_open = False
+
+    def on_failure(self):
+        self.fails += 1
+        self.half_open = False
+        if self.fails >= self.fail_threshold:
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        """End an inconclusive trial so the next caller can try again"""
+        self.half_open = False
+
+
+agi_breaker = Breaker()
+
+
+async def call_agi(method_name: str, coro_factory):
+    """
+    Call the AGI service through the circuit breaker, with retries and
+    the per-method deadline from AGI_DEADLINES. Empty fallback results
+    (see DEGRADED_RESULT_CHECKS) are retried as transient failures.
+    """
+    agi_breaker.before()
+    try:
+        result = await asyncio.wait_for(
+            with_retry(coro_factory, DEGRADED_RESULT_CHECKS[method_name]),
+            timeout=AGI_DEADLINES[method_name]
+        )
+    except BaseException as e:
+        if isinstance(e, Exception) and _is_transient(e):
+            agi_breaker.on_failure()
+        else:
+            # A bug or cancellation says nothing about AGI's health
+            agi_breaker.release()
+        raise
+    agi_breaker.on_success()
+    return result
+
+
+def record_exception(results: "TestResult", test_name: str, error: Exception, prefix: str = ""):
+    """
+    Record a test's exception as a skip or a failure.
+
+    Upstream flakiness is recorded as a skip: an open circuit breaker, a
+    timeout, or the empty fallback AGIService returns when it swallows a
+    429/5xx or network error. Anything else (logic bugs) is a failure.
+    """
+    if isinstance(error, BreakerOpen):
+        results.record_skip(test_name, "AGI breaker open")
+    elif isinstance(error, DegradedResult):
+        results.record_skip(test_name, f"upstream failure (AGI service returned empty fallback data): {error}")
+    elif _is_transient(error):
+        results.record_skip(test_name, f"transient upstream: {error!r}")
+    else:
+        results.record_fail(test_name, f"{prefix}{error}")
+
+
+def validate_json_structure(data: Dict, required_keys: FrozenSet[str], test_name: str) -> bool:
     """Validate JSON structure has required keys"""
-    missing_keys = [key for key in required_keys if key not in data]
+    missing_keys = required_keys - data.keys()
     if missing_keys:
-        print(f"   ⚠️  Missing keys: {missing_keys}")
+        print(f"   ⚠️  Missing keys: {sorted(missing_keys)}")
         return False
     return True
 
@@ -131,17 +319,19 @@ async def test_agi_scrape_business_context(results: TestResult):
 
         # Initialize AGI service
         print("\n📡 Initializing AGI service...")
-        agi_service = AGIService()
+        agi_service = get_agi_service()
 
         # Extract business context
         print(f"🔍 Extracting business context from {TEST_BUSINESS_URL}...")
         print("⏱️  This may take 60-120 seconds...")
 
-        business_context = await agi_service.extract_business_context(TEST_BUSINESS_URL)
+        business_context = await call_agi(
+            "extract_business_context",
+            lambda: agi_service.extract_business_context(TEST_BUSINESS_URL)
+        )
 
         # Validate response structure
-        required_keys = ["business_name", "industry", "description"]
-        if not validate_json_structure(business_context, required_keys, test_name):
+        if not validate_json_structure(business_context, _BUSINESS_CONTEXT_REQUIRED, test_name):
             results.record_fail(test_name, "Missing required keys in response")
             return
 
@@ -168,16 +358,19 @@ async def test_agi_scrape_business_context(results: TestResult):
             results.record_fail(test_name, "description is too short or empty")
             return
 
-        # Save output
-        save_json_output("business_context.json", business_context)
+        # Hand off to dependent tests; save a copy for manual inspection
+        shared_state["business_context"] = business_context
+        save_json_output_in_background("business_context.json", business_context)
 
         results.record_pass(
             test_name,
             f"Extracted context for {business_name} in {industry} industry"
         )
 
+    except asyncio.TimeoutError:
+        results.record_skip(test_name, f"exceeded {AGI_DEADLINES['extract_business_context']}s deadline")
     except Exception as e:
-        results.record_fail(test_name, str(e))
+        record_exception(results, test_name, e)
 
 
 async def test_agi_discover_competitors(results: TestResult):
@@ -209,9 +402,9 @@ async def test_agi_discover_competitors(results: TestResult):
             results.record_skip(test_name, "AGI_API_KEY not set in environment")
             return
 
-        # Load business context from previous test
-        business_context_file = OUTPUT_DIR / "business_context.json"
-        if not business_context_file.exists():
+        # Use business context from previous test
+        business_context = shared_state.get("business_context")
+        if not business_context:
             # Create minimal business context for testing
             business_context = {
                 "business_name": TEST_BUSINESS_NAME,
@@ -221,21 +414,21 @@ async def test_agi_discover_competitors(results: TestResult):
                 "specialties": ["specialty coffee", "pour-over"]
             }
             print("⚠️  Using fallback business context (previous test skipped)")
-        else:
-            with open(business_context_file, 'r') as f:
-                business_context = json.load(f)
 
         # Initialize AGI service
         print("\n📡 Initializing AGI service...")
-        agi_service = AGIService()
+        agi_service = get_agi_service()
 
         # Discover competitors
         print(f"🔍 Discovering competitors for {business_context.get('business_name')}...")
         print("⏱️  This may take 120-180 seconds (includes web searches)...")
 
-        competitors = await agi_service.discover_competitors(
-            business_context=business_context,
-            num_competitors=3
+        competitors = await call_agi(
+            "discover_competitors",
+            lambda: agi_service.discover_competitors(
+                business_context=business_context,
+                num_competitors=NUM_COMPETITORS
+            )
         )
 
         # Validate response
@@ -262,16 +455,19 @@ async def test_agi_discover_competitors(results: TestResult):
                 results.record_fail(test_name, "Competitor missing 'name' field")
                 return
 
-        # Save output
-        save_json_output("competitors.json", competitors)
+        # Hand off to dependent tests; save a copy for manual inspection
+        shared_state["competitors"] = competitors
+        save_json_output_in_background("competitors.json", competitors)
 
         results.record_pass(
             test_name,
             f"Discovered {len(competitors)} competitors autonomously"
         )
 
+    except asyncio.TimeoutError:
+        results.record_skip(test_name, f"exceeded {AGI_DEADLINES['discover_competitors']}s deadline")
     except Exception as e:
-        results.record_fail(test_name, str(e))
+        record_exception(results, test_name, e)
 
 
 async def test_agi_scrape_online_reviews(results: TestResult):
@@ -311,21 +507,23 @@ async def test_agi_scrape_online_reviews(results: TestResult):
 
         # Initialize AGI service
         print("\n📡 Initializing AGI service...")
-        agi_service = AGIService()
+        agi_service = get_agi_service()
 
         # Scrape reviews
         print(f"🔍 Scraping online reviews for {TEST_BUSINESS_NAME}...")
         print("⏱️  This may take 120-180 seconds (includes web searches + scraping)...")
 
-        reviews_data = await agi_service.scrape_online_reviews(
-            business_name=TEST_BUSINESS_NAME,
-            location=TEST_LOCATION,
-            limit=20
+        reviews_data = await call_agi(
+            "scrape_online_reviews",
+            lambda: agi_service.scrape_online_reviews(
+                business_name=TEST_BUSINESS_NAME,
+                location=TEST_LOCATION,
+                limit=REVIEW_LIMIT
+            )
         )
 
         # Validate response structure
-        required_keys = ["reviews", "overall_rating", "total_reviews", "sources"]
-        if not validate_json_structure(reviews_data, required_keys, test_name):
+        if not validate_json_structure(reviews_data, _REVIEWS_REQUIRED, test_name):
             results.record_fail(test_name, "Missing required keys in response")
             return
 
@@ -361,15 +559,17 @@ async def test_agi_scrape_online_reviews(results: TestResult):
                 return
 
         # Save output
-        save_json_output("reviews.json", reviews_data)
+        save_json_output_in_background("reviews.json", reviews_data)
 
         results.record_pass(
             test_name,
             f"Scraped {len(reviews)} reviews from {len(sources)} sources"
         )
 
+    except asyncio.TimeoutError:
+        results.record_skip(test_name, f"exceeded {AGI_DEADLINES['scrape_online_reviews']}s deadline")
     except Exception as e:
-        results.record_fail(test_name, str(e))
+        record_exception(results, test_name, e)
 
 
 async def test_agi_error_handling(results: TestResult):
@@ -391,7 +591,7 @@ async def test_agi_error_handling(results: TestResult):
 
         # Initialize AGI service
         print("\n📡 Initializing AGI service...")
-        agi_service = AGIService()
+        agi_service = get_agi_service()
 
         # Test 1: Invalid URL
         print("\n🧪 Test 1: Invalid URL")
@@ -444,7 +644,7 @@ async def test_agi_error_handling(results: TestResult):
         )
 
     except Exception as e:
-        results.record_fail(test_name, f"Unexpected error: {str(e)}")
+        record_exception(results, test_name, e, prefix="Unexpected error: ")
 
 
 async def test_agi_research_competitor(results: TestResult):
@@ -473,14 +673,12 @@ async def test_agi_research_competitor(results: TestResult):
             results.record_skip(test_name, "AGI_API_KEY not set in environment")
             return
 
-        # Load competitors from previous test
-        competitors_file = OUTPUT_DIR / "competitors.json"
-        if not competitors_file.exists():
-            results.record_skip(test_name, "No competitors.json found (previous test skipped)")
+        # Use competitors from previous test
+        if "competitors" not in shared_state:
+            results.record_skip(test_name, "No competitors discovered (previous test skipped)")
             return
 
-        with open(competitors_file, 'r') as f:
-            competitors = json.load(f)
+        competitors = shared_state["competitors"]
 
         if not competitors or len(competitors) == 0:
             results.record_skip(test_name, "No competitors available for research")
@@ -500,15 +698,18 @@ async def test_agi_research_competitor(results: TestResult):
 
         # Initialize AGI service
         print("\n📡 Initializing AGI service...")
-        agi_service = AGIService()
+        agi_service = get_agi_service()
 
         # Research competitor
         print(f"🔍 Deep research on {competitor_name}...")
         print("⏱️  This may take 120-180 seconds...")
 
-        research_data = await agi_service.research_competitor(
-            competitor_url=competitor_url,
-            competitor_name=competitor_name
+        research_data = await call_agi(
+            "research_competitor",
+            lambda: agi_service.research_competitor(
+                competitor_url=competitor_url,
+                competitor_name=competitor_name
+            )
         )
 
         # Validate response
@@ -530,15 +731,29 @@ async def test_agi_research_competitor(results: TestResult):
         print(f"   Content Themes: {len(themes)}")
 
         # Save output
-        save_json_output(f"competitor_research_{competitor_name.replace(' ', '_').lower()}.json", research_data)
+        save_json_output_in_background(f"competitor_research_{competitor_name.replace(' ', '_').lower()}.json", research_data)
 
         results.record_pass(
             test_name,
             f"Completed deep research on {competitor_name}"
         )
 
+    except asyncio.TimeoutError:
+        results.record_skip(test_name, f"exceeded {AGI_DEADLINES['research_competitor']}s deadline")
     except Exception as e:
-        results.record_fail(test_name, str(e))
+        record_exception(results, test_name, e)
+
+
+# Tests grouped by data dependency: business context feeds competitor
+# discovery, which feeds competitor research. Each stage waits for the last.
+TEST_STAGES = [
+    [test_agi_scrape_business_context, test_agi_scrape_online_reviews, test_agi_error_handling],
+    [test_agi_discover_competitors],
+    [test_agi_research_competitor],
+]
+
+# Bulkhead: cap in-flight AGI tests so we don't flood the AGI API
+MAX_CONCURRENT_TESTS = 3
 
 
 async def main():
@@ -558,14 +773,25 @@ async def main():
     # Initialize test results tracker
     results = TestResult()
 
-    # Run tests sequentially (AGI tasks take time)
+    # Run tests in dependency stages; tests within a stage run concurrently.
+    # Output from concurrent tests may interleave.
     print("\n🚀 Starting test execution...\n")
 
-    await test_agi_scrape_business_context(results)
-    await test_agi_discover_competitors(results)
-    await test_agi_scrape_online_reviews(results)
-    await test_agi_research_competitor(results)
-    await test_agi_error_handling(results)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+
+    async def run_bounded(test_func):
+        async with sem:
+            await test_func(results)
+
+    for stage in TEST_STAGES:
+        await asyncio.gather(*(run_bounded(test_func) for test_func in stage))
+
+    # Make sure background saves have landed before listing output files
+    await asyncio.gather(*_pending_saves)
+
+    # Release the shared AGI service if it holds resources
+    if _agi_service_singleton and hasattr(_agi_service_singleton, "aclose"):
+        await _agi_service_singleton.aclose()
 
     # Print summary
     success = results.print_summary()
@@ -19,71 +19,153 @@ Test Coverage:
 6. Autonomous campaign generation (POST /api/generate-autonomous)
 7. Error handling (404, 500)
 8. Request validation (400)
+
+Run under pytest, where each test is isolated and can be spread across
+workers with pytest-xdist. --dist loadgroup keeps the tests that share a
+generated campaign on one worker, so each campaign is started only once:
+    pytest -n auto --dist loadgroup --tb=short -q tests/test_api_endpoints.py
+
+Running the file as a script (python tests/test_api_endpoints.py) executes
+the same tests in order and stops at the first failed assertion.
+
+Tests always hit the live server unless RECORD=1 (record a cassette) or
+REPLAY=1 (replay it offline) is set; see API_ENDPOINT_TEST_README.md.
 """
 
 import asyncio
+import contextlib
 import sys
 import os
-
-# Load environment variables
 import httpx
 import time
-import json
-from typing import Dict, Any
+import orjson
+import pytest
+import pytest_asyncio
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Load environment variables
-from dotenv import load_dotenv
 from pathlib import Path
-load_dotenv(Path(__file__).parent.parent / ".env")
 
 
 
 
 BASE_URL = "http://localhost:8080"
 TIMEOUT = 30.0  # seconds
+# Set TEST_VERBOSE=1 to dump full request/response payloads
+VERBOSE = bool(int(os.getenv("TEST_VERBOSE", "0")))
+CASSETTE_PATH = Path(__file__).parent / "cassettes" / "endpoints.yaml"
+CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+GENERATE_REQUEST = {"business_url": "https://www.bluebottlecoffee.com"}
+# Tests sharing a generated campaign are pinned to one xdist worker (with
+# --dist loadgroup) so the session fixtures start each campaign only once
+CAMPAIGN_GROUP = "campaign"
+AUTONOMOUS_CAMPAIGN_GROUP = "autonomous_campaign"
+
+# Share one event loop across the session so the session-scoped client fixture
+# can be awaited from every test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+# ============================================================================
+# Response schemas
+#
+# Each response body is validated in a single model_validate_json() call;
+# a mismatch raises ValidationError naming the offending field. Only the
+# fields the tests rely on are declared, extra fields are ignored.
+# ============================================================================
+
+class HealthResponse(BaseModel):
+    status: str
+
 
+class RootHealthResponse(BaseModel):
+    status: str
+    services: Dict[str, Any]
 
-class TestResults:
-    """Track test results"""
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.errors = []
 
-    def record_pass(self, test_name: str):
-        self.passed += 1
-        print(f"✅ PASS: {test_name}")
+class GenerateResponse(BaseModel):
+    success: bool
+    campaign_id: str
+    message: str
 
-    def record_fail(self, test_name: str, error: str):
-        self.failed += 1
-        self.errors.append((test_name, error))
-        print(f"❌ FAIL: {test_name}")
-        print(f"   Error: {error}")
 
-    def summary(self):
-        print("\n" + "="*80)
-        print("TEST SUMMARY")
-        print("="*80)
-        print(f"Passed: {self.passed}")
-        print(f"Failed: {self.failed}")
-        print(f"Total:  {self.passed + self.failed}")
+class ProgressModel(BaseModel):
+    current_step: str
+    step_number: int
+    total_steps: int
+    message: str
+    percentage: float
 
-        if self.failed > 0:
-            print("\nFailed Tests:")
-            for test_name, error in self.errors:
-                print(f"  - {test_name}: {error}")
 
-        print("="*80)
-        return self.failed == 0
+class CampaignResponse(BaseModel):
+    campaign_id: str
+    business_url: str
+    status: str
+    progress: ProgressModel
 
 
-results = TestResults()
+class ProgressUpdatesResponse(BaseModel):
+    campaign_id: str
+    status: str
+    progress_updates: List[Any]
 
 
-async def test_health_endpoint():
+class ScratchpadResponse(BaseModel):
+    campaign_id: str
+    status: str
+    iterations: int
+    scratchpad: Any
+    quality_scores: Any
+    past_learnings_count: int
+
+
+class CampaignListResponse(BaseModel):
+    campaigns: List[Any]
+    total: int
+
+
+class ErrorResponse(BaseModel):
+    detail: Any
+
+
+def api_cassette():
+    """
+    Optionally record or replay HTTP traffic with VCR.py.
+
+    By default tests run against the live server with no cassette, so a
+    stopped server is reported as such instead of being masked by stale
+    recordings. Set RECORD=1 to hit the live server and (re)write
+    CASSETTE_PATH, or REPLAY=1 to replay CASSETTE_PATH without touching the
+    network (unrecorded requests fail).
+    """
+    record = os.getenv("RECORD") == "1"
+    replay = os.getenv("REPLAY") == "1"
+    if not (record or replay):
+        return contextlib.nullcontext()
+    if record and replay:
+        raise RuntimeError("Set only one of RECORD=1 and REPLAY=1")
+
+    try:
+        import vcr
+    except ImportError:
+        print("⚠️  vcrpy not installed - running against live server (pip install vcrpy)")
+        return contextlib.nullcontext()
+
+    if record:
+        return vcr.use_cassette(str(CASSETTE_PATH), record_mode="all")
+    # Polling helpers may repeat a request more times than were recorded
+    return vcr.use_cassette(str(CASSETTE_PATH), record_mode="none", allow_playback_repeats=True)
+
+
+def pretty(data: Any) -> str:
+    """Pretty-print JSON data for debug output"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+async def test_health_endpoint(client: httpx.AsyncClient):
     """
     Test: GET /health returns 200 with status ok
 
@@ -93,27 +175,19 @@ async def test_health_endpoint():
     }
     """
     print("\n=== Test: Health Endpoint ===")
-    test_name = "test_health_endpoint"
+    response = await client.get("/health")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/health", timeout=TIMEOUT)
-
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            # Verify response body
-            data = response.json()
-            assert data["status"] == "ok", f"Expected status='ok', got {data.get('status')}"
+    # Verify response body
+    data = HealthResponse.model_validate_json(response.content)
+    assert data.status == "ok", f"Expected status='ok', got {data.status}"
 
-            print(f"Response: {data}")
-            results.record_pass(test_name)
+    print(f"Response: {data.model_dump()}")
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
 
-
-async def test_root_health_endpoint():
+async def test_root_health_endpoint(client: httpx.AsyncClient):
     """
     Test: GET / returns 200 with detailed health check
 
@@ -128,29 +202,40 @@ async def test_root_health_endpoint():
     }
     """
     print("\n=== Test: Root Health Endpoint ===")
-    test_name = "test_root_health_endpoint"
+    response = await client.get("/")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/", timeout=TIMEOUT)
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    # Verify response body
+    data = RootHealthResponse.model_validate_json(response.content)
+    assert data.status == "healthy", f"Expected status='healthy', got {data.status}"
 
-            # Verify response body
-            data = response.json()
-            assert data["status"] == "healthy", f"Expected status='healthy', got {data.get('status')}"
-            assert "services" in data, "Missing 'services' field"
-            assert isinstance(data["services"], dict), "'services' must be a dict"
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+async def start_campaign(client: httpx.AsyncClient, path: str) -> httpx.Response:
+    """POST the standard generate request to path and return the raw response"""
+    print(f"Request: POST {path}")
+    if VERBOSE:
+        print(f"Body: {pretty(GENERATE_REQUEST)}")
 
+    return await client.post(path, json=GENERATE_REQUEST)
+
+
+def campaign_id_from(response: httpx.Response, prefix: str) -> Optional[str]:
+    """Return the campaign_id of a successful generate response, else None"""
+    if response.status_code != 200:
+        return None
+    campaign_id = orjson.loads(response.content).get("campaign_id")
+    if not isinstance(campaign_id, str) or not campaign_id.startswith(prefix):
+        return None
+    return campaign_id
 
-async def test_generate_campaign_endpoint():
+
+@pytest.mark.xdist_group(CAMPAIGN_GROUP)
+async def test_generate_campaign_endpoint(generate_response: httpx.Response):
     """
     Test: POST /api/generate starts campaign generation
 
@@ -162,46 +247,22 @@ async def test_generate_campaign_endpoint():
     }
     """
     print("\n=== Test: Generate Campaign Endpoint ===")
-    test_name = "test_generate_campaign_endpoint"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            # Send request
-            request_data = {
-                "business_url": "https://www.bluebottlecoffee.com"
-            }
-
-            print(f"Request: POST /api/generate")
-            print(f"Body: {json.dumps(request_data, indent=2)}")
-
-            response = await client.post(
-                f"{BASE_URL}/api/generate",
-                json=request_data,
-                timeout=TIMEOUT
-            )
+    response = generate_response
 
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            # Verify response body
-            data = response.json()
-            assert data["success"] == True, f"Expected success=true, got {data.get('success')}"
-            assert "campaign_id" in data, "Missing 'campaign_id' field"
-            assert data["campaign_id"].startswith("campaign_"), "campaign_id should start with 'campaign_'"
-            assert "message" in data, "Missing 'message' field"
+    # Verify response body
+    data = GenerateResponse.model_validate_json(response.content)
+    assert data.success, f"Expected success=true, got {data.success}"
+    assert data.campaign_id.startswith("campaign_"), "campaign_id should start with 'campaign_'"
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
-            # Return campaign_id for subsequent tests
-            return data["campaign_id"]
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
-        return None
-
-
-async def test_get_campaign_endpoint(campaign_id: str):
+@pytest.mark.xdist_group(CAMPAIGN_GROUP)
+async def test_get_campaign_endpoint(client: httpx.AsyncClient, campaign_id: str):
     """
     Test: GET /api/campaigns/{id} returns complete campaign data
 
@@ -218,43 +279,25 @@ async def test_get_campaign_endpoint(campaign_id: str):
     }
     """
     print("\n=== Test: Get Campaign Endpoint ===")
-    test_name = "test_get_campaign_endpoint"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns/{campaign_id}")
-
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/{campaign_id}",
-                timeout=TIMEOUT
-            )
-
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    print(f"Request: GET /api/campaigns/{campaign_id}")
 
-            # Verify response body
-            data = response.json()
-            assert data["campaign_id"] == campaign_id, "campaign_id mismatch"
-            assert "business_url" in data, "Missing 'business_url' field"
-            assert "status" in data, "Missing 'status' field"
-            assert "progress" in data, "Missing 'progress' field"
+    response = await client.get(
+        f"/api/campaigns/{campaign_id}"
+    )
 
-            # Verify progress structure
-            progress = data["progress"]
-            assert "current_step" in progress, "Missing progress.current_step"
-            assert "step_number" in progress, "Missing progress.step_number"
-            assert "total_steps" in progress, "Missing progress.total_steps"
-            assert "message" in progress, "Missing progress.message"
-            assert "percentage" in progress, "Missing progress.percentage"
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            print(f"Response (truncated): {json.dumps({k: v for k, v in data.items() if k in ['campaign_id', 'business_url', 'status', 'progress']}, indent=2)}")
-            results.record_pass(test_name)
+    # Verify response body, including the nested progress structure
+    data = CampaignResponse.model_validate_json(response.content)
+    assert data.campaign_id == campaign_id, "campaign_id mismatch"
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+    if VERBOSE:
+        print(f"Response (truncated): {pretty(data.model_dump())}")
 
 
-async def test_get_progress_endpoint(campaign_id: str):
+@pytest.mark.xdist_group(CAMPAIGN_GROUP)
+async def test_get_progress_endpoint(client: httpx.AsyncClient, campaign_id: str):
     """
     Test: GET /api/campaigns/{id}/progress returns progress updates
 
@@ -266,35 +309,25 @@ async def test_get_progress_endpoint(campaign_id: str):
     }
     """
     print("\n=== Test: Get Progress Endpoint ===")
-    test_name = "test_get_progress_endpoint"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns/{campaign_id}/progress")
-
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/{campaign_id}/progress",
-                timeout=TIMEOUT
-            )
+    print(f"Request: GET /api/campaigns/{campaign_id}/progress")
 
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    response = await client.get(
+        f"/api/campaigns/{campaign_id}/progress"
+    )
 
-            # Verify response body
-            data = response.json()
-            assert data["campaign_id"] == campaign_id, "campaign_id mismatch"
-            assert "status" in data, "Missing 'status' field"
-            assert "progress_updates" in data, "Missing 'progress_updates' field"
-            assert isinstance(data["progress_updates"], list), "'progress_updates' must be a list"
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
+    # Verify response body
+    data = ProgressUpdatesResponse.model_validate_json(response.content)
+    assert data.campaign_id == campaign_id, "campaign_id mismatch"
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
 
-async def test_get_scratchpad_endpoint(campaign_id: str):
+@pytest.mark.xdist_group(CAMPAIGN_GROUP)
+async def test_get_scratchpad_endpoint(client: httpx.AsyncClient, campaign_id: str):
     """
     Test: GET /api/campaigns/{id}/scratchpad returns scratchpad data
 
@@ -309,37 +342,24 @@ async def test_get_scratchpad_endpoint(campaign_id: str):
     }
     """
     print("\n=== Test: Get Scratchpad Endpoint ===")
-    test_name = "test_get_scratchpad_endpoint"
+    print(f"Request: GET /api/campaigns/{campaign_id}/scratchpad")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns/{campaign_id}/scratchpad")
-
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/{campaign_id}/scratchpad",
-                timeout=TIMEOUT
-            )
-
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    response = await client.get(
+        f"/api/campaigns/{campaign_id}/scratchpad"
+    )
 
-            # Verify response body
-            data = response.json()
-            assert data["campaign_id"] == campaign_id, "campaign_id mismatch"
-            assert "status" in data, "Missing 'status' field"
-            assert "iterations" in data, "Missing 'iterations' field"
-            assert "scratchpad" in data, "Missing 'scratchpad' field"
-            assert "quality_scores" in data, "Missing 'quality_scores' field"
-            assert "past_learnings_count" in data, "Missing 'past_learnings_count' field"
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
+    # Verify response body
+    data = ScratchpadResponse.model_validate_json(response.content)
+    assert data.campaign_id == campaign_id, "campaign_id mismatch"
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
 
-async def test_list_campaigns_endpoint():
+async def test_list_campaigns_endpoint(client: httpx.AsyncClient):
     """
     Test: GET /api/campaigns returns list of all campaigns
 
@@ -350,205 +370,126 @@ async def test_list_campaigns_endpoint():
     }
     """
     print("\n=== Test: List Campaigns Endpoint ===")
-    test_name = "test_list_campaigns_endpoint"
+    print(f"Request: GET /api/campaigns")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns")
+    response = await client.get(
+        "/api/campaigns"
+    )
 
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns",
-                timeout=TIMEOUT
-            )
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    # Verify response body
+    data = CampaignListResponse.model_validate_json(response.content)
+    assert len(data.campaigns) == data.total, "campaigns count mismatch"
 
-            # Verify response body
-            data = response.json()
-            assert "campaigns" in data, "Missing 'campaigns' field"
-            assert "total" in data, "Missing 'total' field"
-            assert isinstance(data["campaigns"], list), "'campaigns' must be a list"
-            assert len(data["campaigns"]) == data["total"], "campaigns count mismatch"
+    print(f"Response: Found {data.total} campaign(s)")
 
-            print(f"Response: Found {data['total']} campaign(s)")
-            results.record_pass(test_name)
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+# (path, test name, whether detail must say "not found")
+INVALID_ID_CASES = [
+    ("/api/campaigns/invalid_campaign_id", "test_invalid_campaign_id", True),
+    ("/api/campaigns/invalid/progress", "test_invalid_progress_id", False),
+    ("/api/campaigns/invalid/scratchpad", "test_invalid_scratchpad_id", False),
+]
 
 
-async def test_invalid_campaign_id():
+async def _assert_404(client: httpx.AsyncClient, path: str, test_name: str, expect_not_found: bool):
     """
-    Test: GET /api/campaigns/invalid returns 404
+    Test: GET {path} for an unknown campaign returns 404
 
     Expected Response:
     {
         "detail": "Campaign not found"
     }
     """
-    print("\n=== Test: Invalid Campaign ID (404) ===")
-    test_name = "test_invalid_campaign_id"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns/invalid_campaign_id")
+    print(f"\n=== Test: {test_name} (404) ===")
 
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/invalid_campaign_id",
-                timeout=TIMEOUT
-            )
+    print(f"Request: GET {path}")
 
-            # Verify status code
-            assert response.status_code == 404, f"Expected 404, got {response.status_code}"
+    response = await client.get(path)
 
-            # Verify response body
-            data = response.json()
-            assert "detail" in data, "Missing 'detail' field"
-            assert "not found" in data["detail"].lower(), "Error message should mention 'not found'"
+    # Verify status code
+    assert response.status_code == 404, f"Expected 404, got {response.status_code}"
 
-            print(f"Response: {data}")
-            results.record_pass(test_name)
+    # Verify response body
+    data = ErrorResponse.model_validate_json(response.content)
+    if expect_not_found:
+        assert "not found" in data.detail.lower(), "Error message should mention 'not found'"
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+    print(f"Response: {data.model_dump()}")
 
 
-async def test_invalid_progress_id():
+async def test_invalid_ids(client: httpx.AsyncClient):
     """
-    Test: GET /api/campaigns/invalid/progress returns 404
+    Test: campaign, progress and scratchpad lookups with invalid IDs return 404
     """
-    print("\n=== Test: Invalid Progress ID (404) ===")
-    test_name = "test_invalid_progress_id"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns/invalid/progress")
-
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/invalid/progress",
-                timeout=TIMEOUT
-            )
-
-            # Verify status code
-            assert response.status_code == 404, f"Expected 404, got {response.status_code}"
-
-            # Verify response body
-            data = response.json()
-            assert "detail" in data, "Missing 'detail' field"
-
-            print(f"Response: {data}")
-            results.record_pass(test_name)
+    await asyncio.gather(*[
+        _assert_404(client, path, test_name, expect_not_found)
+        for path, test_name, expect_not_found in INVALID_ID_CASES
+    ])
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
 
-
-async def test_invalid_scratchpad_id():
-    """
-    Test: GET /api/campaigns/invalid/scratchpad returns 404
-    """
-    print("\n=== Test: Invalid Scratchpad ID (404) ===")
-    test_name = "test_invalid_scratchpad_id"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            print(f"Request: GET /api/campaigns/invalid/scratchpad")
-
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/invalid/scratchpad",
-                timeout=TIMEOUT
-            )
-
-            # Verify status code
-            assert response.status_code == 404, f"Expected 404, got {response.status_code}"
-
-            # Verify response body
-            data = response.json()
-            assert "detail" in data, "Missing 'detail' field"
-
-            print(f"Response: {data}")
-            results.record_pass(test_name)
-
-    except Exception as e:
-        results.record_fail(test_name, str(e))
-
-
-async def test_invalid_request_body():
+async def test_invalid_request_body(client: httpx.AsyncClient):
     """
     Test: POST /api/generate with invalid body returns 422
 
     Expected: Validation error for invalid URL
     """
     print("\n=== Test: Invalid Request Body (422) ===")
-    test_name = "test_invalid_request_body"
+    # Send request with invalid URL
+    request_data = {
+        "business_url": "not-a-valid-url"
+    }
 
-    try:
-        async with httpx.AsyncClient() as client:
-            # Send request with invalid URL
-            request_data = {
-                "business_url": "not-a-valid-url"
-            }
-
-            print(f"Request: POST /api/generate")
-            print(f"Body: {json.dumps(request_data, indent=2)}")
-
-            response = await client.post(
-                f"{BASE_URL}/api/generate",
-                json=request_data,
-                timeout=TIMEOUT
-            )
+    print(f"Request: POST /api/generate")
+    if VERBOSE:
+        print(f"Body: {pretty(request_data)}")
 
-            # Verify status code (422 for validation errors)
-            assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+    response = await client.post(
+        "/api/generate",
+        json=request_data
+    )
 
-            # Verify response body
-            data = response.json()
-            assert "detail" in data, "Missing 'detail' field"
+    # Verify status code (422 for validation errors)
+    assert response.status_code == 422, f"Expected 422, got {response.status_code}"
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
+    # Verify response body
+    data = ErrorResponse.model_validate_json(response.content)
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
 
-async def test_missing_required_field():
+async def test_missing_required_field(client: httpx.AsyncClient):
     """
     Test: POST /api/generate with missing required field returns 422
     """
     print("\n=== Test: Missing Required Field (422) ===")
-    test_name = "test_missing_required_field"
+    # Send request with missing business_url
+    request_data = {}
 
-    try:
-        async with httpx.AsyncClient() as client:
-            # Send request with missing business_url
-            request_data = {}
-
-            print(f"Request: POST /api/generate")
-            print(f"Body: {json.dumps(request_data, indent=2)}")
-
-            response = await client.post(
-                f"{BASE_URL}/api/generate",
-                json=request_data,
-                timeout=TIMEOUT
-            )
+    print(f"Request: POST /api/generate")
+    if VERBOSE:
+        print(f"Body: {pretty(request_data)}")
 
-            # Verify status code (422 for validation errors)
-            assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+    response = await client.post(
+        "/api/generate",
+        json=request_data
+    )
 
-            # Verify response body
-            data = response.json()
-            assert "detail" in data, "Missing 'detail' field"
+    # Verify status code (422 for validation errors)
+    assert response.status_code == 422, f"Expected 422, got {response.status_code}"
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
+    # Verify response body
+    data = ErrorResponse.model_validate_json(response.content)
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
 
-async def test_generate_autonomous_campaign_endpoint():
+@pytest.mark.xdist_group(AUTONOMOUS_CAMPAIGN_GROUP)
+async def test_generate_autonomous_campaign_endpoint(autonomous_generate_response: httpx.Response):
     """
     Test: POST /api/generate-autonomous starts autonomous campaign
 
@@ -560,47 +501,23 @@ async def test_generate_autonomous_campaign_endpoint():
     }
     """
     print("\n=== Test: Generate Autonomous Campaign Endpoint ===")
-    test_name = "test_generate_autonomous_campaign_endpoint"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            # Send request
-            request_data = {
-                "business_url": "https://www.bluebottlecoffee.com"
-            }
-
-            print(f"Request: POST /api/generate-autonomous")
-            print(f"Body: {json.dumps(request_data, indent=2)}")
-
-            response = await client.post(
-                f"{BASE_URL}/api/generate-autonomous",
-                json=request_data,
-                timeout=TIMEOUT
-            )
-
-            # Verify status code
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    response = autonomous_generate_response
 
-            # Verify response body
-            data = response.json()
-            assert data["success"] == True, f"Expected success=true, got {data.get('success')}"
-            assert "campaign_id" in data, "Missing 'campaign_id' field"
-            assert data["campaign_id"].startswith("autonomous_"), "campaign_id should start with 'autonomous_'"
-            assert "message" in data, "Missing 'message' field"
-            assert "scratchpad" in data["message"].lower(), "Message should mention scratchpad"
+    # Verify status code
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            print(f"Response: {json.dumps(data, indent=2)}")
-            results.record_pass(test_name)
+    # Verify response body
+    data = GenerateResponse.model_validate_json(response.content)
+    assert data.success, f"Expected success=true, got {data.success}"
+    assert data.campaign_id.startswith("autonomous_"), "campaign_id should start with 'autonomous_'"
+    assert "scratchpad" in data.message.lower(), "Message should mention scratchpad"
 
-            # Return campaign_id for subsequent tests
-            return data["campaign_id"]
-
-    except Exception as e:
-        results.record_fail(test_name, str(e))
-        return None
+    if VERBOSE:
+        print(f"Response: {pretty(data.model_dump())}")
 
 
-async def test_background_task_execution(campaign_id: str):
+@pytest.mark.xdist_group(CAMPAIGN_GROUP)
+async def test_background_task_execution(client: httpx.AsyncClient, campaign_id: str):
     """
     Test: Background task starts and updates campaign status
 
@@ -610,53 +527,131 @@ async def test_background_task_execution(campaign_id: str):
     3. Background task doesn't block API
     """
     print("\n=== Test: Background Task Execution ===")
-    test_name = "test_background_task_execution"
+    # Poll until the background task has started (or give up after a few seconds)
+    response = await wait_for_status_change(client, campaign_id, "researching")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            # Wait a moment for background task to start
-            await asyncio.sleep(2)
-
-            # Check campaign status
-            response = await client.get(
-                f"{BASE_URL}/api/campaigns/{campaign_id}",
-                timeout=TIMEOUT
-            )
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+    data = CampaignResponse.model_validate_json(response.content)
+    status = data.status
+
+    print(f"Campaign Status: {status}")
+    print(f"Progress: {data.progress.percentage}%")
+    print(f"Current Step: {data.progress.current_step}")
+    print(f"Message: {data.progress.message}")
+
+    # Verify background task is running
+    # Status should not be 'completed' yet (unless very fast)
+    # and should have started (not still 0%)
+    assert status in ["researching", "analyzing", "creating", "publishing", "reasoning", "completed"], \
+        f"Unexpected status: {status}"
+
+    print("✓ Background task execution verified")
 
-            assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-            data = response.json()
-            status = data["status"]
-            percentage = data["progress"]["percentage"]
+async def wait_for_status_change(
+    client: httpx.AsyncClient,
+    campaign_id: str,
+    initial_status: str,
+    max_s: float = 5.0
+) -> httpx.Response:
+    """
+    Poll GET /api/campaigns/{id} until the background task has started.
 
-            print(f"Campaign Status: {status}")
-            print(f"Progress: {percentage}%")
-            print(f"Current Step: {data['progress']['current_step']}")
-            print(f"Message: {data['progress']['message']}")
+    Returns as soon as the status leaves initial_status or progress is above
+    0%, backing off exponentially between polls (capped at 1s). Returns the
+    last response after max_s seconds either way.
+    """
+    deadline = time.monotonic() + max_s
+    attempt = 0
+    while True:
+        response = await client.get(f"/api/campaigns/{campaign_id}")
+        if response.status_code != 200:
+            return response
 
-            # Verify background task is running
-            # Status should not be 'completed' yet (unless very fast)
-            # and should have started (not still 0%)
-            assert status in ["researching", "analyzing", "creating", "publishing", "reasoning", "completed"], \
-                f"Unexpected status: {status}"
+        data = orjson.loads(response.content)
+        if data["status"] != initial_status or data["progress"]["percentage"] > 0:
+            return response
 
-            print("✓ Background task execution verified")
-            results.record_pass(test_name)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return response
 
-    except Exception as e:
-        results.record_fail(test_name, str(e))
+        await asyncio.sleep(min(max_s / 10 * 2 ** attempt, 1.0, remaining))
+        attempt += 1
 
 
-async def check_server_running() -> bool:
+@pytest.mark.xdist_group(AUTONOMOUS_CAMPAIGN_GROUP)
+async def test_autonomous_scratchpad_endpoint(client: httpx.AsyncClient, autonomous_campaign_id: str):
     """
-    Check if FastAPI server is running
+    Test: GET /api/campaigns/{id}/scratchpad once an autonomous campaign starts reasoning
     """
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/health", timeout=5.0)
-            return response.status_code == 200
-    except:
-        return False
+    # Wait for background task to start
+    await wait_for_status_change(client, autonomous_campaign_id, "reasoning")
+    await test_get_scratchpad_endpoint(client, autonomous_campaign_id)
+
+
+# ---------------------------------------------------------------------------
+# pytest fixtures
+#
+# Session-scoped so a pytest session starts at most one regular and one
+# autonomous campaign; dependent tests request the campaign ID fixture instead
+# of relying on execution order. Session fixtures are per xdist worker, so the
+# dependent tests share an xdist_group (run with --dist loadgroup).
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    with api_cassette():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, timeout=TIMEOUT, limits=CLIENT_LIMITS, http2=True
+        ) as c:
+            # Probe on the shared client so its connection is reused by the tests
+            try:
+                r = await c.get("/health", timeout=5.0)
+                assert r.status_code == 200
+            except Exception:
+                pytest.skip(f"FastAPI server is not running at {BASE_URL}")
+            yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def generate_response(client: httpx.AsyncClient) -> httpx.Response:
+    return await start_campaign(client, "/api/generate")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def autonomous_generate_response(client: httpx.AsyncClient) -> httpx.Response:
+    return await start_campaign(client, "/api/generate-autonomous")
+
+
+@pytest.fixture(scope="session")
+def campaign_id(generate_response: httpx.Response) -> str:
+    campaign_id = campaign_id_from(generate_response, "campaign_")
+    if campaign_id is None:
+        pytest.skip("Campaign generation did not start")
+    return campaign_id
+
+
+@pytest.fixture(scope="session")
+def autonomous_campaign_id(autonomous_generate_response: httpx.Response) -> str:
+    campaign_id = campaign_id_from(autonomous_generate_response, "autonomous_")
+    if campaign_id is None:
+        pytest.skip("Autonomous campaign generation did not start")
+    return campaign_id
+
+
+async def regular_campaign_checks(client: httpx.AsyncClient, campaign_id: str):
+    """Retrieval, progress, scratchpad and background-task checks for a campaign"""
+    await test_get_campaign_endpoint(client, campaign_id)
+    await test_get_progress_endpoint(client, campaign_id)
+    await test_get_scratchpad_endpoint(client, campaign_id)
+    await test_background_task_execution(client, campaign_id)
+
+
+async def autonomous_campaign_checks(client: httpx.AsyncClient, autonomous_campaign_id: str):
+    """Scratchpad check once the autonomous campaign starts reasoning"""
+    await test_autonomous_scratchpad_endpoint(client, autonomous_campaign_id)
 
 
 async def main():
@@ -669,71 +664,80 @@ async def main():
     print(f"\nTarget Server: {BASE_URL}")
     print(f"Timeout: {TIMEOUT}s per request")
 
-    # Check if server is running
-    print("\n🔍 Checking if FastAPI server is running...")
-    if not await check_server_running():
-        print("\n❌ ERROR: FastAPI server is not running!")
-        print("\nPlease start the server first:")
-        print("  cd backend")
-        print("  ./run.sh")
-        print("\nOr:")
-        print("  cd backend")
-        print("  python main.py")
-        return False
-
-    print("✅ Server is running!\n")
-
-    # Run tests in order
-    print("Starting endpoint tests...")
-    print("="*80)
-
-    # Test 1: Health endpoints
-    await test_health_endpoint()
-    await test_root_health_endpoint()
-
-    # Test 2: Campaign generation
-    campaign_id = await test_generate_campaign_endpoint()
-
-    if campaign_id:
-        # Test 3: Campaign retrieval
-        await test_get_campaign_endpoint(campaign_id)
-        await test_get_progress_endpoint(campaign_id)
-        await test_get_scratchpad_endpoint(campaign_id)
-
-        # Test 4: Background task execution
-        await test_background_task_execution(campaign_id)
-
-    # Test 5: List campaigns
-    await test_list_campaigns_endpoint()
-
-    # Test 6: Error handling
-    await test_invalid_campaign_id()
-    await test_invalid_progress_id()
-    await test_invalid_scratchpad_id()
-    await test_invalid_request_body()
-    await test_missing_required_field()
-
-    # Test 7: Autonomous campaign generation
-    autonomous_campaign_id = await test_generate_autonomous_campaign_endpoint()
+    # Record or replay HTTP traffic when RECORD=1 / REPLAY=1 (see api_cassette)
+    with api_cassette():
+        # One shared client for every test so connections are pooled and reused.
+        # HTTP/2 is negotiated via ALPN where the server offers it (e.g. behind a
+        # TLS proxy); against plain-http uvicorn it falls back to HTTP/1.1.
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, timeout=TIMEOUT, limits=CLIENT_LIMITS, http2=True
+        ) as client:
+            # Check if server is running, on the same connection the tests reuse
+            print("\n🔍 Checking if FastAPI server is running...")
+            try:
+                r = await client.get("/health", timeout=5.0)
+                assert r.status_code == 200
+            except Exception:
+                print("\n❌ ERROR: FastAPI server is not running!")
+                print("\nPlease start the server first:")
+                print("  cd backend")
+                print("  ./run.sh")
+                print("\nOr:")
+                print("  cd backend")
+                print("  python main.py")
+                return False
+
+            print("✅ Server is running!\n")
+
+            # Run tests in order
+            print("Starting endpoint tests...")
+            print("="*80)
+
+            # Tests that don't depend on a generated campaign run concurrently:
+            # health endpoints, list campaigns, and error handling
+            await asyncio.gather(
+                test_health_endpoint(client),
+                test_root_health_endpoint(client),
+                test_list_campaigns_endpoint(client),
+                test_invalid_ids(client),
+                test_invalid_request_body(client),
+                test_missing_required_field(client),
+            )
 
-    if autonomous_campaign_id:
-        # Wait a moment for background task to start
-        await asyncio.sleep(2)
+            # Regular and autonomous campaign generation start together
+            response, autonomous_response = await asyncio.gather(
+                start_campaign(client, "/api/generate"),
+                start_campaign(client, "/api/generate-autonomous"),
+            )
+            await test_generate_campaign_endpoint(response)
+            await test_generate_autonomous_campaign_endpoint(autonomous_response)
+
+            # The two campaigns share no state, so the autonomous warm-up
+            # overlaps the regular campaign's checks
+            await asyncio.gather(
+                regular_campaign_checks(client, campaign_id_from(response, "campaign_")),
+                autonomous_campaign_checks(
+                    client, campaign_id_from(autonomous_response, "autonomous_")
+                ),
+            )
 
-        # Check scratchpad for autonomous campaign
-        await test_get_scratchpad_endpoint(autonomous_campaign_id)
+    # Any failed assertion has already propagated out of main()
+    print("\n🎉 All tests passed!")
+    return True
 
-    # Print summary
-    success = results.summary()
 
-    if success:
-        print("\n🎉 All tests passed!")
-        return True
-    else:
-        print(f"\n⚠️  {results.failed} test(s) failed")
-        return False
+if __name__ == "__main__":
+    # Under pytest tests/conftest.py loads .env; script runs load it here
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent / ".env")
 
+    # libuv-based event loop for the many small localhost requests; uvloop
+    # ships with uvicorn[standard], fall back to asyncio's loop without it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
-if __name__ == "__main__":
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
@@ -17,23 +17,22 @@ Test Philosophy (CLAUDE.md):
 """
 
 import asyncio
+import functools
+import hashlib
+import itertools
 import sys
 import os
-
-# Load environment variables
+import statistics
 import time
-import uuid
-import json
+import traceback
+import orjson
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Awaitable, Callable, List, NamedTuple, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Load environment variables
-from dotenv import load_dotenv
 from pathlib import Path
-load_dotenv(Path(__file__).parent.parent / ".env")
 
 
 
@@ -54,10 +53,76 @@ from models import (
     CampaignProgress
 )
 
+# Section divider for test output
+DIVIDER = "=" * 70
+
+# One ConvexService (and its underlying client connection) for the whole run
+_convex_service_singleton: Optional[ConvexService] = None
+
+
+def get_convex_service() -> ConvexService:
+    """Return the shared ConvexService, creating it on first call"""
+    global _convex_service_singleton
+    if _convex_service_singleton is None:
+        _convex_service_singleton = ConvexService()
+    return _convex_service_singleton
+
+
+# Campaign IDs only need to be unique, not unguessable: a per-run prefix
+# (pid + start time, so reruns don't collide with rows left in Convex) plus
+# a counter avoids an OS random read per ID
+_RUN_PREFIX = f"{os.getpid()}_{int(time.time())}"
+_id_counter = itertools.count()
+
+
+def new_test_id(prefix: str) -> str:
+    """Return a campaign ID unique to this test run"""
+    return f"{prefix}_{_RUN_PREFIX}_{next(_id_counter)}"
+
+
+# The research, analytics and creative store tests write to separate tables,
+# so they share one campaign record instead of creating one each
+STORE_TESTS_CAMPAIGN_ID = new_test_id("test_store")
+_campaign_creations: Dict[str, asyncio.Task] = {}
+
+
+async def ensure_campaign(service: ConvexService, campaign_id: str) -> bool:
+    """
+    Create campaign_id on first call; later (or concurrent) callers await
+    the same creation instead of issuing another create_campaign. A failed
+    creation is not cached, so the next caller retries it.
+
+    Returns:
+        True if this call started the creation, False if it reused one
+    """
+    task = _campaign_creations.get(campaign_id)
+    created = task is None
+    if created:
+        task = asyncio.ensure_future(service.create_campaign(campaign_id))
+        _campaign_creations[campaign_id] = task
+    try:
+        await task
+    except Exception:
+        if _campaign_creations.get(campaign_id) is task:
+            del _campaign_creations[campaign_id]
+        raise
+    return created
+
+
 # ============================================================================
 # Test Data Factories
+#
+# Factories that build the same data on every call are cached, so pydantic
+# validates each fixture once per run. The cached objects are shared: treat
+# them as read-only, or model_copy(deep=True) before mutating. Factories
+# taking a campaign_id are keyed by a unique ID and are not cached.
 # ============================================================================
 
+# Fixed timestamp for test outputs; the stored value is never asserted on
+_FIXTURE_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@functools.cache
 def create_test_business_context() -> BusinessContext:
     """Create test business context data"""
     return BusinessContext(
@@ -73,6 +138,7 @@ def create_test_business_context() -> BusinessContext:
     )
 
 
+@functools.cache
 def create_test_competitors() -> List[CompetitorInfo]:
     """Create test competitor data"""
     return [
@@ -105,6 +171,7 @@ def create_test_competitors() -> List[CompetitorInfo]:
     ]
 
 
+@functools.cache
 def create_test_market_insights() -> MarketInsights:
     """Create test market insights data"""
     return MarketInsights(
@@ -126,10 +193,11 @@ def create_test_research_output(campaign_id: str) -> ResearchOutput:
         competitors=create_test_competitors(),
         market_insights=create_test_market_insights(),
         research_images=[],
-        timestamp=datetime.now()
+        timestamp=_FIXTURE_TS
     )
 
 
+@functools.cache
 def create_test_customer_sentiment() -> CustomerSentiment:
     """Create test customer sentiment data"""
     return CustomerSentiment(
@@ -148,6 +216,7 @@ def create_test_customer_sentiment() -> CustomerSentiment:
     )
 
 
+@functools.cache
 def create_test_performance_patterns() -> PerformancePatterns:
     """Create test performance patterns data"""
     return PerformancePatterns(
@@ -169,6 +238,7 @@ def create_test_performance_patterns() -> PerformancePatterns:
     )
 
 
+@functools.cache
 def create_test_trend_data() -> TrendData:
     """Create test trend data"""
     return TrendData(
@@ -189,27 +259,33 @@ def create_test_analytics_output(campaign_id: str) -> AnalyticsOutput:
         past_performance=create_test_performance_patterns(),
         market_trends=create_test_trend_data(),
         customer_photos=[],
-        timestamp=datetime.now()
+        timestamp=_FIXTURE_TS
     )
 
 
+# Fields shared by every test day; only the day-specific strings are built per call
+_DAY_HASHTAGS = ("#coffeelover", "#specialtycoffee")
+_DAY_MEDIA_PREFIX = "https://pub-test.r2.dev/campaigns/test/day_"
+_VIDEO_DAYS = frozenset({1, 4, 7})
+
+
+@functools.cache
 def create_test_day_content(day: int) -> DayContent:
     """Create test day content"""
+    media = f"{_DAY_MEDIA_PREFIX}{day}"
     return DayContent(
         day=day,
         theme=f"Day {day} Theme",
         caption=f"Test caption for day {day} #coffeelover #specialtycoffee",
-        hashtags=["#coffeelover", "#specialtycoffee", f"#day{day}"],
-        image_urls=[
-            f"https://pub-test.r2.dev/campaigns/test/day_{day}_1.jpg",
-            f"https://pub-test.r2.dev/campaigns/test/day_{day}_2.jpg"
-        ],
-        video_url=f"https://pub-test.r2.dev/campaigns/test/day_{day}_video.mp4" if day in [1, 4, 7] else None,
+        hashtags=[*_DAY_HASHTAGS, f"#day{day}"],
+        image_urls=[f"{media}_1.jpg", f"{media}_2.jpg"],
+        video_url=f"{media}_video.mp4" if day in _VIDEO_DAYS else None,
         cta="Visit us today!",
         recommended_post_time=f"{10 + day}:00 AM"
     )
 
 
+@functools.cache
 def create_test_learning_data() -> LearningData:
     """Create test learning data"""
     return LearningData(
@@ -243,14 +319,29 @@ def create_test_creative_output(campaign_id: str) -> CreativeOutput:
         days=days,
         learning_data=create_test_learning_data(),
         status="completed",
-        timestamp=datetime.now()
+        timestamp=_FIXTURE_TS
     )
 
 
 # ============================================================================
 # Test Functions
+#
+# Each test buffers its output with log() and writes it in one call when it
+# finishes, so tests running concurrently don't interleave their output.
 # ============================================================================
 
+class Outcome(NamedTuple):
+    """Result of one test: whether it passed and the campaign IDs it created"""
+    passed: bool
+    campaign_ids: List[str]
+
+
+def flush_output(out: List[str]) -> None:
+    """Write buffered output lines to stdout in one call"""
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+
+
 async def test_convex_create_campaign():
     """
     Test: Create campaign and verify it exists in Convex
@@ -261,23 +352,26 @@ async def test_convex_create_campaign():
     - Initial status is 'pending'
     - Initial progress is 0
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Create Campaign")
-    print("="*70)
+    out: List[str] = []
+    log = out.append
+
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Create Campaign")
+    log(DIVIDER)
 
     try:
-        service = ConvexService()
-        campaign_id = f"test_campaign_{uuid.uuid4().hex[:8]}"
+        service = get_convex_service()
+        campaign_id = new_test_id("test_campaign")
 
-        print(f"Creating campaign: {campaign_id}")
+        log(f"Creating campaign: {campaign_id}")
 
         # Create campaign
         start_time = time.time()
         result = await service.create_campaign(campaign_id)
         elapsed = time.time() - start_time
 
-        print(f"✓ Campaign created in {elapsed:.2f}s")
-        print(f"  Result: {result}")
+        log(f"✓ Campaign created in {elapsed:.2f}s")
+        log(f"  Result: {result}")
 
         # Verify campaign exists by retrieving progress
         progress = await service.get_progress(campaign_id)
@@ -285,22 +379,23 @@ async def test_convex_create_campaign():
         if not progress:
             raise AssertionError(f"Campaign {campaign_id} not found after creation")
 
-        print(f"✓ Campaign verified:")
-        print(f"  Status: {progress.status}")
-        print(f"  Progress: {progress.percentage}%")
+        log(f"✓ Campaign verified:")
+        log(f"  Status: {progress.status}")
+        log(f"  Progress: {progress.percentage}%")
 
         # Verify initial state
         assert progress.status == "pending", f"Expected status 'pending', got '{progress.status}'"
         assert progress.percentage == 0, f"Expected progress 0, got {progress.percentage}"
 
-        print("✅ TEST PASSED: Campaign created successfully")
-        return True, campaign_id
+        log("✅ TEST PASSED: Campaign created successfully")
+        return Outcome(True, [campaign_id])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_update_progress():
@@ -312,17 +407,20 @@ async def test_convex_update_progress():
     - Query returns updated values
     - All fields match expected values
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Update Progress")
-    print("="*70)
+    out: List[str] = []
+    log = out.append
+
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Update Progress")
+    log(DIVIDER)
 
     try:
-        service = ConvexService()
-        campaign_id = f"test_progress_{uuid.uuid4().hex[:8]}"
+        service = get_convex_service()
+        campaign_id = new_test_id("test_progress")
 
         # Create campaign first
         await service.create_campaign(campaign_id)
-        print(f"✓ Campaign created: {campaign_id}")
+        log(f"✓ Campaign created: {campaign_id}")
 
         # Update progress to 50%
         await service.update_progress(
@@ -333,7 +431,7 @@ async def test_convex_update_progress():
             message="Analyzing customer sentiment"
         )
 
-        print("✓ Progress updated to 50%")
+        log("✓ Progress updated to 50%")
 
         # Verify update
         progress = await service.get_progress(campaign_id)
@@ -341,10 +439,10 @@ async def test_convex_update_progress():
         if not progress:
             raise AssertionError(f"Campaign {campaign_id} not found")
 
-        print(f"✓ Progress retrieved:")
-        print(f"  Status: {progress.status}")
-        print(f"  Progress: {progress.percentage}%")
-        print(f"  Message: {progress.message}")
+        log(f"✓ Progress retrieved:")
+        log(f"  Status: {progress.status}")
+        log(f"  Progress: {progress.percentage}%")
+        log(f"  Message: {progress.message}")
 
         # Verify values
         assert progress.status == "agent2_running", f"Expected 'agent2_running', got '{progress.status}'"
@@ -363,15 +461,16 @@ async def test_convex_update_progress():
         progress = await service.get_progress(campaign_id)
         assert progress.percentage == 100, f"Expected 100, got {progress.percentage}"
 
-        print("✓ Progress updated to 100%")
-        print("✅ TEST PASSED: Progress tracking works correctly")
-        return True, campaign_id
+        log("✓ Progress updated to 100%")
+        log("✅ TEST PASSED: Progress tracking works correctly")
+        return Outcome(True, [campaign_id])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_store_research():
@@ -384,31 +483,35 @@ async def test_convex_store_research():
     - All nested objects preserved
     - Data integrity maintained
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Store Research Data")
-    print("="*70)
-
-    try:
-        service = ConvexService()
-        campaign_id = f"test_research_{uuid.uuid4().hex[:8]}"
+    out: List[str] = []
+    log = out.append
 
-        # Create campaign
-        await service.create_campaign(campaign_id)
-        print(f"✓ Campaign created: {campaign_id}")
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Store Research Data")
+    log(DIVIDER)
 
-        # Create research data
-        research_data = create_test_research_output(campaign_id)
-        print(f"✓ Test research data created:")
-        print(f"  Business: {research_data.business_context.business_name}")
-        print(f"  Competitors: {len(research_data.competitors)}")
-        print(f"  Trending topics: {len(research_data.market_insights.trending_topics)}")
+    try:
+        service = get_convex_service()
+        campaign_id = STORE_TESTS_CAMPAIGN_ID
+
+        # Create (or reuse) the shared campaign, building the research data
+        # while the write is in flight
+        research_data, created = await asyncio.gather(
+            asyncio.to_thread(create_test_research_output, campaign_id),
+            ensure_campaign(service, campaign_id),
+        )
+        log(f"✓ Campaign {'created' if created else 'reused'}: {campaign_id}")
+        log(f"✓ Test research data created:")
+        log(f"  Business: {research_data.business_context.business_name}")
+        log(f"  Competitors: {len(research_data.competitors)}")
+        log(f"  Trending topics: {len(research_data.market_insights.trending_topics)}")
 
         # Store research data
         start_time = time.time()
         result = await service.store_research(research_data)
         elapsed = time.time() - start_time
 
-        print(f"✓ Research stored in {elapsed:.2f}s")
+        log(f"✓ Research stored in {elapsed:.2f}s")
 
         # Retrieve and verify
         retrieved = await service.get_research(campaign_id)
@@ -416,28 +519,26 @@ async def test_convex_store_research():
         if not retrieved:
             raise AssertionError(f"Research data not found for campaign {campaign_id}")
 
-        print("✓ Research data retrieved")
+        log("✓ Research data retrieved")
 
-        # Verify data integrity
+        # Verify data integrity: the whole round-tripped model must match
         assert retrieved.campaign_id == campaign_id, "Campaign ID mismatch"
-        assert retrieved.business_context.business_name == research_data.business_context.business_name, "Business name mismatch"
-        assert len(retrieved.competitors) == len(research_data.competitors), "Competitor count mismatch"
-        assert retrieved.competitors[0].name == research_data.competitors[0].name, "Competitor name mismatch"
-        assert len(retrieved.market_insights.trending_topics) == len(research_data.market_insights.trending_topics), "Trending topics count mismatch"
+        assert retrieved.model_dump() == research_data.model_dump(), "Research data mismatch after round-trip"
 
-        print("✓ Data integrity verified:")
-        print(f"  ✓ Business name: {retrieved.business_context.business_name}")
-        print(f"  ✓ Competitors: {len(retrieved.competitors)} competitors")
-        print(f"  ✓ Market insights: {len(retrieved.market_insights.trending_topics)} trending topics")
+        log("✓ Data integrity verified:")
+        log(f"  ✓ Business name: {retrieved.business_context.business_name}")
+        log(f"  ✓ Competitors: {len(retrieved.competitors)} competitors")
+        log(f"  ✓ Market insights: {len(retrieved.market_insights.trending_topics)} trending topics")
 
-        print("✅ TEST PASSED: Research data stored and retrieved correctly")
-        return True, campaign_id
+        log("✅ TEST PASSED: Research data stored and retrieved correctly")
+        return Outcome(True, [campaign_id])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_store_analytics():
@@ -450,31 +551,35 @@ async def test_convex_store_analytics():
     - All nested objects preserved (sentiment, performance, trends)
     - Data integrity maintained
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Store Analytics Data")
-    print("="*70)
-
-    try:
-        service = ConvexService()
-        campaign_id = f"test_analytics_{uuid.uuid4().hex[:8]}"
+    out: List[str] = []
+    log = out.append
 
-        # Create campaign
-        await service.create_campaign(campaign_id)
-        print(f"✓ Campaign created: {campaign_id}")
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Store Analytics Data")
+    log(DIVIDER)
 
-        # Create analytics data
-        analytics_data = create_test_analytics_output(campaign_id)
-        print(f"✓ Test analytics data created:")
-        print(f"  Positive themes: {len(analytics_data.customer_sentiment.positive_themes)}")
-        print(f"  Popular items: {len(analytics_data.customer_sentiment.popular_items)}")
-        print(f"  Trending searches: {len(analytics_data.market_trends.trending_searches)}")
+    try:
+        service = get_convex_service()
+        campaign_id = STORE_TESTS_CAMPAIGN_ID
+
+        # Create (or reuse) the shared campaign, building the analytics data
+        # while the write is in flight
+        analytics_data, created = await asyncio.gather(
+            asyncio.to_thread(create_test_analytics_output, campaign_id),
+            ensure_campaign(service, campaign_id),
+        )
+        log(f"✓ Campaign {'created' if created else 'reused'}: {campaign_id}")
+        log(f"✓ Test analytics data created:")
+        log(f"  Positive themes: {len(analytics_data.customer_sentiment.positive_themes)}")
+        log(f"  Popular items: {len(analytics_data.customer_sentiment.popular_items)}")
+        log(f"  Trending searches: {len(analytics_data.market_trends.trending_searches)}")
 
         # Store analytics data
         start_time = time.time()
         result = await service.store_analytics(analytics_data)
         elapsed = time.time() - start_time
 
-        print(f"✓ Analytics stored in {elapsed:.2f}s")
+        log(f"✓ Analytics stored in {elapsed:.2f}s")
 
         # Retrieve and verify
         retrieved = await service.get_analytics(campaign_id)
@@ -482,30 +587,28 @@ async def test_convex_store_analytics():
         if not retrieved:
             raise AssertionError(f"Analytics data not found for campaign {campaign_id}")
 
-        print("✓ Analytics data retrieved")
+        log("✓ Analytics data retrieved")
 
-        # Verify data integrity
+        # Verify data integrity: the whole round-tripped model must match
         assert retrieved.campaign_id == campaign_id, "Campaign ID mismatch"
-        assert len(retrieved.customer_sentiment.positive_themes) == len(analytics_data.customer_sentiment.positive_themes), "Positive themes count mismatch"
-        assert retrieved.customer_sentiment.popular_items[0] == analytics_data.customer_sentiment.popular_items[0], "Popular items mismatch"
         assert retrieved.past_performance is not None, "Past performance missing"
-        assert len(retrieved.past_performance.recommendations) == len(analytics_data.past_performance.recommendations), "Recommendations count mismatch"
-        assert len(retrieved.market_trends.trending_searches) == len(analytics_data.market_trends.trending_searches), "Trending searches count mismatch"
+        assert retrieved.model_dump() == analytics_data.model_dump(), "Analytics data mismatch after round-trip"
 
-        print("✓ Data integrity verified:")
-        print(f"  ✓ Positive themes: {len(retrieved.customer_sentiment.positive_themes)}")
-        print(f"  ✓ Popular items: {len(retrieved.customer_sentiment.popular_items)}")
-        print(f"  ✓ Recommendations: {len(retrieved.past_performance.recommendations)}")
-        print(f"  ✓ Trending searches: {len(retrieved.market_trends.trending_searches)}")
+        log("✓ Data integrity verified:")
+        log(f"  ✓ Positive themes: {len(retrieved.customer_sentiment.positive_themes)}")
+        log(f"  ✓ Popular items: {len(retrieved.customer_sentiment.popular_items)}")
+        log(f"  ✓ Recommendations: {len(retrieved.past_performance.recommendations)}")
+        log(f"  ✓ Trending searches: {len(retrieved.market_trends.trending_searches)}")
 
-        print("✅ TEST PASSED: Analytics data stored and retrieved correctly")
-        return True, campaign_id
+        log("✅ TEST PASSED: Analytics data stored and retrieved correctly")
+        return Outcome(True, [campaign_id])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_store_creative():
@@ -518,31 +621,35 @@ async def test_convex_store_creative():
     - Learning data preserved
     - Retrieved data matches stored data
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Store Creative Content")
-    print("="*70)
-
-    try:
-        service = ConvexService()
-        campaign_id = f"test_creative_{uuid.uuid4().hex[:8]}"
+    out: List[str] = []
+    log = out.append
 
-        # Create campaign
-        await service.create_campaign(campaign_id)
-        print(f"✓ Campaign created: {campaign_id}")
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Store Creative Content")
+    log(DIVIDER)
 
-        # Create creative data
-        creative_data = create_test_creative_output(campaign_id)
-        print(f"✓ Test creative data created:")
-        print(f"  Days: {len(creative_data.days)}")
-        print(f"  Video days: {len([d for d in creative_data.days if d.video_url])}")
-        print(f"  Learnings: {len(creative_data.learning_data.what_worked)}")
+    try:
+        service = get_convex_service()
+        campaign_id = STORE_TESTS_CAMPAIGN_ID
+
+        # Create (or reuse) the shared campaign, building the creative data
+        # while the write is in flight
+        creative_data, created = await asyncio.gather(
+            asyncio.to_thread(create_test_creative_output, campaign_id),
+            ensure_campaign(service, campaign_id),
+        )
+        log(f"✓ Campaign {'created' if created else 'reused'}: {campaign_id}")
+        log(f"✓ Test creative data created:")
+        log(f"  Days: {len(creative_data.days)}")
+        log(f"  Video days: {len([d for d in creative_data.days if d.video_url])}")
+        log(f"  Learnings: {len(creative_data.learning_data.what_worked)}")
 
         # Store creative data
         start_time = time.time()
         result = await service.store_content(creative_data)
         elapsed = time.time() - start_time
 
-        print(f"✓ Creative content stored in {elapsed:.2f}s")
+        log(f"✓ Creative content stored in {elapsed:.2f}s")
 
         # Retrieve and verify
         retrieved = await service.get_content(campaign_id)
@@ -550,7 +657,7 @@ async def test_convex_store_creative():
         if not retrieved:
             raise AssertionError(f"Creative data not found for campaign {campaign_id}")
 
-        print("✓ Creative data retrieved")
+        log("✓ Creative data retrieved")
 
         # Verify data integrity
         assert retrieved.campaign_id == campaign_id, "Campaign ID mismatch"
@@ -558,11 +665,10 @@ async def test_convex_store_creative():
         assert retrieved.status == "completed", f"Expected 'completed', got '{retrieved.status}'"
 
         # Verify day content
-        for day_num in range(1, 8):
-            day = retrieved.days[day_num - 1]
+        for day_num, day in enumerate(retrieved.days, start=1):
             assert day.day == day_num, f"Day number mismatch: expected {day_num}, got {day.day}"
             assert len(day.image_urls) == 2, f"Day {day_num}: expected 2 images, got {len(day.image_urls)}"
-            if day_num in [1, 4, 7]:
+            if day_num in _VIDEO_DAYS:
                 assert day.video_url is not None, f"Day {day_num}: video missing"
 
         # Verify learning data
@@ -570,20 +676,21 @@ async def test_convex_store_creative():
         assert len(retrieved.learning_data.what_to_improve) > 0, "Learning data missing 'what_to_improve'"
         assert "focus_areas" in retrieved.learning_data.next_iteration_strategy, "Strategy missing 'focus_areas'"
 
-        print("✓ Data integrity verified:")
-        print(f"  ✓ Days: {len(retrieved.days)}")
-        print(f"  ✓ Videos: {len([d for d in retrieved.days if d.video_url])}")
-        print(f"  ✓ What worked: {len(retrieved.learning_data.what_worked)} insights")
-        print(f"  ✓ What to improve: {len(retrieved.learning_data.what_to_improve)} items")
+        log("✓ Data integrity verified:")
+        log(f"  ✓ Days: {len(retrieved.days)}")
+        log(f"  ✓ Videos: {len([d for d in retrieved.days if d.video_url])}")
+        log(f"  ✓ What worked: {len(retrieved.learning_data.what_worked)} insights")
+        log(f"  ✓ What to improve: {len(retrieved.learning_data.what_to_improve)} items")
 
-        print("✅ TEST PASSED: Creative content stored and retrieved correctly")
-        return True, campaign_id
+        log("✅ TEST PASSED: Creative content stored and retrieved correctly")
+        return Outcome(True, [campaign_id])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_async_operations():
@@ -595,17 +702,20 @@ async def test_convex_async_operations():
     - Total time < sum of individual times (proves non-blocking)
     - All operations complete successfully
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Async Operations (Non-Blocking)")
-    print("="*70)
+    out: List[str] = []
+    log = out.append
+
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Async Operations (Non-Blocking)")
+    log(DIVIDER)
 
     try:
-        service = ConvexService()
+        service = get_convex_service()
 
         # Create 3 campaigns concurrently
-        campaign_ids = [f"test_async_{i}_{uuid.uuid4().hex[:8]}" for i in range(3)]
+        campaign_ids = [new_test_id(f"test_async_{i}") for i in range(3)]
 
-        print(f"Creating {len(campaign_ids)} campaigns concurrently...")
+        log(f"Creating {len(campaign_ids)} campaigns concurrently...")
 
         start_time = time.time()
 
@@ -615,8 +725,8 @@ async def test_convex_async_operations():
 
         elapsed = time.time() - start_time
 
-        print(f"✓ All {len(campaign_ids)} campaigns created in {elapsed:.2f}s")
-        print(f"  Average: {elapsed/len(campaign_ids):.2f}s per campaign")
+        log(f"✓ All {len(campaign_ids)} campaigns created in {elapsed:.2f}s")
+        log(f"  Average: {elapsed/len(campaign_ids):.2f}s per campaign")
 
         # Verify all campaigns exist
         for cid in campaign_ids:
@@ -624,46 +734,43 @@ async def test_convex_async_operations():
             if not progress:
                 raise AssertionError(f"Campaign {cid} not found")
 
-        print(f"✓ All {len(campaign_ids)} campaigns verified")
+        log(f"✓ All {len(campaign_ids)} campaigns verified")
 
         # Test concurrent updates
-        print(f"\nUpdating {len(campaign_ids)} campaigns concurrently...")
+        log(f"\nUpdating {len(campaign_ids)} campaigns concurrently...")
 
         start_time = time.time()
 
+        # Only campaign_id and message differ between the updates
+        base_update = dict(status="agent1_running", progress=25, current_agent="Research Agent")
         update_tasks = [
-            service.update_progress(
-                campaign_id=cid,
-                status="agent1_running",
-                progress=25,
-                current_agent="Research Agent",
-                message=f"Test update {i}"
-            )
+            service.update_progress(campaign_id=cid, message=f"Test update {i}", **base_update)
             for i, cid in enumerate(campaign_ids)
         ]
 
         await asyncio.gather(*update_tasks)
         elapsed = time.time() - start_time
 
-        print(f"✓ All {len(campaign_ids)} updates completed in {elapsed:.2f}s")
+        log(f"✓ All {len(campaign_ids)} updates completed in {elapsed:.2f}s")
 
         # Verify non-blocking behavior
         # If operations were blocking, time would be ~3x longer
         max_expected = 5.0  # Generous allowance for network latency
 
         if elapsed > max_expected:
-            print(f"⚠ Warning: Operations may be blocking (took {elapsed:.2f}s)")
+            log(f"⚠ Warning: Operations may be blocking (took {elapsed:.2f}s)")
         else:
-            print(f"✓ Operations are non-blocking (completed in {elapsed:.2f}s)")
+            log(f"✓ Operations are non-blocking (completed in {elapsed:.2f}s)")
 
-        print("✅ TEST PASSED: Async operations work correctly")
-        return True, campaign_ids
+        log("✅ TEST PASSED: Async operations work correctly")
+        return Outcome(True, campaign_ids)
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_full_campaign_data():
@@ -676,65 +783,68 @@ async def test_convex_full_campaign_data():
     - Analytics data present
     - Progress data present
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Get Full Campaign Data")
-    print("="*70)
+    out: List[str] = []
+    log = out.append
+
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Get Full Campaign Data")
+    log(DIVIDER)
 
     try:
-        service = ConvexService()
-        campaign_id = f"test_full_{uuid.uuid4().hex[:8]}"
+        service = get_convex_service()
+        campaign_id = new_test_id("test_full")
 
         # Create campaign
         await service.create_campaign(campaign_id)
-        print(f"✓ Campaign created: {campaign_id}")
+        log(f"✓ Campaign created: {campaign_id}")
 
-        # Store research data
+        # Research, analytics and progress writes are independent once the
+        # campaign exists, so issue them concurrently
         research_data = create_test_research_output(campaign_id)
-        await service.store_research(research_data)
-        print("✓ Research data stored")
-
-        # Store analytics data
         analytics_data = create_test_analytics_output(campaign_id)
-        await service.store_analytics(analytics_data)
-        print("✓ Analytics data stored")
-
-        # Update progress
-        await service.update_progress(
-            campaign_id=campaign_id,
-            status="agent3_running",
-            progress=75,
-            current_agent="Creative Agent",
-            message="Generating content"
+        await asyncio.gather(
+            service.store_research(research_data),
+            service.store_analytics(analytics_data),
+            service.update_progress(
+                campaign_id=campaign_id,
+                status="agent3_running",
+                progress=75,
+                current_agent="Creative Agent",
+                message="Generating content"
+            ),
         )
-        print("✓ Progress updated")
+        log("✓ Research data stored")
+        log("✓ Analytics data stored")
+        log("✓ Progress updated")
 
         # Retrieve full campaign data
-        print("\nRetrieving full campaign data...")
+        log("\nRetrieving full campaign data...")
         start_time = time.time()
 
         full_data = await service.get_full_campaign_data(campaign_id)
         elapsed = time.time() - start_time
 
-        print(f"✓ Full data retrieved in {elapsed:.2f}s")
+        log(f"✓ Full data retrieved in {elapsed:.2f}s")
 
         # Verify all components present
         assert full_data["research"] is not None, "Research data missing"
         assert full_data["analytics"] is not None, "Analytics data missing"
         assert full_data["progress"] is not None, "Progress data missing"
 
-        print("✓ All data components present:")
-        print(f"  ✓ Research: {full_data['research'].business_context.business_name}")
-        print(f"  ✓ Analytics: {len(full_data['analytics'].customer_sentiment.positive_themes)} positive themes")
-        print(f"  ✓ Progress: {full_data['progress'].percentage}% complete")
+        log("✓ All data components present:")
+        log(f"  ✓ Research: {full_data['research'].business_context.business_name}")
+        log(f"  ✓ Analytics: {len(full_data['analytics'].customer_sentiment.positive_themes)} positive themes")
+        log(f"  ✓ Progress: {full_data['progress'].percentage}% complete")
 
-        print("✅ TEST PASSED: Full campaign data retrieved correctly")
-        return True, campaign_id
+        log("✅ TEST PASSED: Full campaign data retrieved correctly")
+        return Outcome(True, [campaign_id])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 async def test_convex_error_handling():
@@ -746,21 +856,24 @@ async def test_convex_error_handling():
     - Clear error messages
     - No unhandled exceptions
     """
-    print("\n" + "="*70)
-    print("TEST: Convex Error Handling")
-    print("="*70)
+    out: List[str] = []
+    log = out.append
+
+    log(f"\n{DIVIDER}")
+    log("TEST: Convex Error Handling")
+    log(DIVIDER)
 
     try:
-        service = ConvexService()
+        service = get_convex_service()
         fake_campaign_id = "nonexistent_campaign_123"
 
-        print(f"Testing retrieval of non-existent campaign: {fake_campaign_id}")
+        log(f"Testing retrieval of non-existent campaign: {fake_campaign_id}")
 
         # Try to get progress for non-existent campaign
         progress = await service.get_progress(fake_campaign_id)
 
         if progress is None:
-            print("✓ Non-existent campaign returns None (as expected)")
+            log("✓ Non-existent campaign returns None (as expected)")
         else:
             raise AssertionError("Expected None for non-existent campaign, got data")
 
@@ -768,7 +881,7 @@ async def test_convex_error_handling():
         research = await service.get_research(fake_campaign_id)
 
         if research is None:
-            print("✓ Non-existent research returns None (as expected)")
+            log("✓ Non-existent research returns None (as expected)")
         else:
             raise AssertionError("Expected None for non-existent research, got data")
 
@@ -776,18 +889,19 @@ async def test_convex_error_handling():
         analytics = await service.get_analytics(fake_campaign_id)
 
         if analytics is None:
-            print("✓ Non-existent analytics returns None (as expected)")
+            log("✓ Non-existent analytics returns None (as expected)")
         else:
             raise AssertionError("Expected None for non-existent analytics, got data")
 
-        print("✅ TEST PASSED: Error handling works correctly")
-        return True, None
+        log("✅ TEST PASSED: Error handling works correctly")
+        return Outcome(True, [])
 
     except Exception as e:
-        print(f"❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False, None
+        log(f"❌ TEST FAILED: {e}")
+        log(traceback.format_exc())
+        return Outcome(False, [])
+    finally:
+        flush_output(out)
 
 
 # ============================================================================
@@ -798,28 +912,61 @@ async def cleanup_test_data(campaign_ids: List[str]):
     """
     Clean up test data from Convex
 
-    Note: Convex doesn't have a public delete API in Python SDK yet,
-    so we log the campaigns that should be cleaned up manually.
+    Deletes every test campaign and its research/analytics/content records
+    with a single campaigns:bulkDelete mutation. If that fails, the IDs are
+    logged for manual cleanup via the dashboard.
     """
-    print("\n" + "="*70)
+    print(f"\n{DIVIDER}")
     print("TEST DATA CLEANUP")
-    print("="*70)
+    print(DIVIDER)
 
-    print("\nTest campaigns created (for manual cleanup if needed):")
-    for cid in campaign_ids:
-        print(f"  - {cid}")
+    print("\nTest campaigns created:")
+    print("\n".join(f"  - {cid}" for cid in campaign_ids))
 
-    print("\nNote: Convex test data can be cleaned up via dashboard:")
-    print("  1. Go to Convex dashboard")
-    print("  2. Navigate to Data tab")
-    print("  3. Filter campaigns table by test_* prefix")
-    print("  4. Delete test records")
+    try:
+        result = await get_convex_service().delete_campaigns(campaign_ids)
+        print(f"\n✓ Deleted {result['deleted']} test record(s)")
+    except Exception as e:
+        print(f"\n⚠ Cleanup failed: {e}")
+        print("\nConvex test data can be cleaned up via dashboard:")
+        print("  1. Go to Convex dashboard")
+        print("  2. Navigate to Data tab")
+        print("  3. Filter campaigns table by test_* prefix")
+        print("  4. Delete test records")
 
 
 # ============================================================================
 # Main Test Runner
 # ============================================================================
 
+# Upper bound on tests running at once against the Convex deployment
+MAX_CONCURRENT_TESTS = 4
+
+# (name, test) pairs run by main()
+TESTS: Tuple[Tuple[str, Callable[[], Awaitable[Outcome]]], ...] = (
+    ("Create Campaign", test_convex_create_campaign),
+    ("Update Progress", test_convex_update_progress),
+    ("Store Research", test_convex_store_research),
+    ("Store Analytics", test_convex_store_analytics),
+    ("Store Creative", test_convex_store_creative),
+    ("Async Operations", test_convex_async_operations),
+    ("Full Campaign Data", test_convex_full_campaign_data),
+    ("Error Handling", test_convex_error_handling),
+)
+
+# Static suite banner, written in one call
+BANNER = "\n".join([
+    f"\n{DIVIDER}",
+    "CONVEX SERVICE TEST SUITE",
+    DIVIDER,
+    "\nTesting with REAL Convex deployment (no mocks)",
+    "Following CLAUDE.md principles:",
+    "  ✓ Real API calls only",
+    "  ✓ Evidence before completion claims",
+    "  ✓ Test autonomous agent data flows",
+]) + "\n"
+
+
 async def main():
     """
     Run all Convex service tests
@@ -829,94 +976,144 @@ async def main():
     - Evidence provided for each test
     - Test data logged for verification
     """
-    print("\n" + "="*70)
-    print("CONVEX SERVICE TEST SUITE")
-    print("="*70)
-    print("\nTesting with REAL Convex deployment (no mocks)")
-    print("Following CLAUDE.md principles:")
-    print("  ✓ Real API calls only")
-    print("  ✓ Evidence before completion claims")
-    print("  ✓ Test autonomous agent data flows")
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
+
+    # Buffered like the tests' own output, flushed once per section
+    out: List[str] = []
+    log = out.append
 
     # Track results
     results = []
     campaign_ids = []
 
-    # Run tests
-    tests = [
-        ("Create Campaign", test_convex_create_campaign),
-        ("Update Progress", test_convex_update_progress),
-        ("Store Research", test_convex_store_research),
-        ("Store Analytics", test_convex_store_analytics),
-        ("Store Creative", test_convex_store_creative),
-        ("Async Operations", test_convex_async_operations),
-        ("Full Campaign Data", test_convex_full_campaign_data),
-        ("Error Handling", test_convex_error_handling),
-    ]
-
-    for test_name, test_func in tests:
-        try:
-            passed, cid = await test_func()
-            results.append((test_name, passed))
-
-            if cid:
-                if isinstance(cid, list):
-                    campaign_ids.extend(cid)
-                else:
-                    campaign_ids.append(cid)
+    # Tests are independent (each uses its own campaign IDs), so run them
+    # concurrently and let their Convex round-trips overlap, bounded so the
+    # shared deployment isn't flooded
+    sem = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    durations_ns: Dict[str, int] = {}
+
+    async def run_bounded(test_name, test_func):
+        async with sem:
+            # Timed from acquiring the slot, so queueing isn't counted
+            start = time.perf_counter_ns()
+            try:
+                return await test_func()
+            finally:
+                durations_ns[test_name] = time.perf_counter_ns() - start
+
+    outcomes = await asyncio.gather(
+        *(run_bounded(test_name, test_func) for test_name, test_func in TESTS),
+        return_exceptions=True
+    )
 
-        except Exception as e:
-            print(f"\n❌ TEST '{test_name}' CRASHED: {e}")
+    for (test_name, _), outcome in zip(TESTS, outcomes):
+        if isinstance(outcome, BaseException):
+            log(f"\n❌ TEST '{test_name}' CRASHED: {outcome}")
             results.append((test_name, False))
+            continue
 
-    # Print summary
-    print("\n" + "="*70)
-    print("TEST SUMMARY")
-    print("="*70)
+        results.append((test_name, outcome.passed))
+        campaign_ids.extend(outcome.campaign_ids)
 
-    passed = sum(1 for _, p in results if p)
-    total = len(results)
+    # Print summary
+    log(f"\n{DIVIDER}")
+    log("TEST SUMMARY")
+    log(DIVIDER)
 
+    # Count passes while listing per-test status, in a single pass
+    passed = 0
     for test_name, passed_flag in results:
+        passed += passed_flag
         status = "✅ PASSED" if passed_flag else "❌ FAILED"
-        print(f"{status}: {test_name}")
+        log(f"{status}: {test_name} ({durations_ns[test_name] / 1e6:.0f} ms)")
+    total = len(results)
+
+    log(f"\nTotal: {passed}/{total} tests passed")
 
-    print(f"\nTotal: {passed}/{total} tests passed")
+    # Per-test wall-clock latency, to see which tests dominate the run
+    latencies = sorted(durations_ns.values())
+    latency = {
+        "p50_ms": statistics.median(latencies) / 1e6,
+        "p95_ms": statistics.quantiles(latencies, n=20, method="inclusive")[18] / 1e6,
+        "max_ms": latencies[-1] / 1e6,
+        "per_test_ms": {name: ns / 1e6 for name, ns in durations_ns.items()},
+    }
+    log(f"Latency: p50 {latency['p50_ms']:.0f} ms, p95 {latency['p95_ms']:.0f} ms, max {latency['max_ms']:.0f} ms")
 
     if passed == total:
-        print("\n🎉 ALL TESTS PASSED!")
+        log("\n🎉 ALL TESTS PASSED!")
     else:
-        print(f"\n⚠ {total - passed} test(s) failed")
+        log(f"\n⚠ {total - passed} test(s) failed")
+
+    flush_output(out)
+    out.clear()
 
-    # Cleanup
-    if campaign_ids:
-        await cleanup_test_data(campaign_ids)
+    # Store tests share a campaign; list each ID once
+    campaign_ids = list(dict.fromkeys(campaign_ids))
 
     # Save test results
     output_dir = Path(__file__).parent / "outputs" / "convex"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    results_file = output_dir / f"test_results_{int(time.time())}.json"
-    with open(results_file, "w") as f:
-        json.dump({
-            "timestamp": datetime.now().isoformat(),
-            "results": [
-                {"test": name, "passed": passed}
-                for name, passed in results
-            ],
-            "summary": {
-                "total": total,
-                "passed": passed,
-                "failed": total - passed
-            },
-            "test_campaigns": campaign_ids
-        }, f, indent=2)
-
-    print(f"\n✓ Test results saved to: {results_file}")
+    # Nanosecond timestamp so back-to-back runs don't overwrite each other
+    results_file = output_dir / f"test_results_{time.time_ns()}.json"
+    outcome = {
+        "results": [
+            {"test": name, "passed": passed_flag}
+            for name, passed_flag in results
+        ],
+        "summary": {
+            "total": total,
+            "passed": passed,
+            "failed": total - passed
+        }
+    }
+    # The results file is always written, since latency and campaign IDs
+    # change every run. Only the outcome section is deduplicated: when it
+    # matches the last full results file (the newest one with a .sha sidecar
+    # holding the outcome digest), it is replaced by a reference to that file
+    digest = hashlib.blake2b(orjson.dumps(outcome), digest_size=8).hexdigest()
+    latest_sha = max(output_dir.glob("test_results_*.sha"), key=lambda p: p.stat().st_mtime, default=None)
+    unchanged = latest_sha is not None and latest_sha.read_text() == digest
+
+    payload = {
+        "timestamp": datetime.now().isoformat(),
+        **({"outcome_from": latest_sha.with_suffix(".json").name} if unchanged else outcome),
+        "latency": latency,
+        "test_campaigns": campaign_ids
+    }
+
+    def save_results():
+        output_dir.mkdir(parents=True, exist_ok=True)
+        results_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        if not unchanged:
+            results_file.with_suffix(".sha").write_text(digest)
+
+    # Cleanup overlaps the results write, which runs on a worker thread
+    await asyncio.gather(
+        cleanup_test_data(campaign_ids) if campaign_ids else asyncio.sleep(0),
+        asyncio.to_thread(save_results),
+    )
+
+    log(f"\n✓ Test results saved to: {results_file}")
+    if unchanged:
+        log(f"  Outcome unchanged since {payload['outcome_from']}")
+    flush_output(out)
 
     return passed == total
 
 
 if __name__ == "__main__":
+    # Under pytest tests/conftest.py loads .env; script runs load it here
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent / ".env")
+
+    # libuv-based event loop for the Convex I/O; uvloop ships with
+    # uvicorn[standard], fall back to asyncio's loop without it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
@@ -26,14 +26,17 @@ WARNING: This test suite is SLOW (15-20 minutes) due to:
 - R2 uploads and URL validation
 """
 import asyncio
+import functools
 import sys
 import os
 
 # Load environment variables
 import json
+import random
+import tempfile
 import uuid
 import httpx
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 # Add parent directory to path
@@ -47,11 +50,11 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 
 
 
-from agents.creative_agent import CreativeAgent
+from agents.creative_agent import CreativeAgent, CreativeCheckpointer
 from agents.research_agent import ResearchAgent
 from agents.strategy_agent import StrategyAgent
 from services.gemini_service import GeminiService
-from services.minimax_service import MiniMaxService
+from services.minimax_service import MiniMaxService, RETRYABLE_STATUS_CODES
 from services.convex_service import ConvexService
 from services.r2_service import R2Service
 from services.agi_service import AGIService
@@ -63,10 +66,35 @@ OUTPUT_DIR = Path(__file__).parent / "outputs" / "agents" / "creative"
 MIN_IMAGE_SIZE_KB = 10
 MIN_VIDEO_SIZE_KB = 100
 TEST_BUSINESS_URL = "https://www.bluebottlecoffee.com"
+MAX_CONCURRENT_URL_CHECKS = 16
+URL_CHECK_ATTEMPTS = 3
 
 # Test results tracking
 test_results = []
 
+# One pooled client for every R2 URL check, so HEAD requests to the same
+# host reuse a kept-alive connection instead of a fresh TCP+TLS handshake
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first call"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared httpx client if it was created"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def log_test_result(test_name: str, passed: bool, message: str):
     """Log test result for summary"""
@@ -80,40 +108,115 @@ def log_test_result(test_name: str, passed: bool, message: str):
     })
 
 
-def save_json(data: Dict[str, Any], filename: str) -> Path:
-    """Save JSON data to output directory"""
+async def save_json(data: Dict[str, Any], filename: str) -> Path:
+    """
+    Save JSON data to output directory
+
+    Serializing a full campaign output can take tens of ms, so the dump and
+    write run on a worker thread instead of blocking concurrent tests.
+    """
     file_path = OUTPUT_DIR / filename
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+
+    def write():
+        with open(file_path, "w") as f:
+            json.dump(data, f, indent=2, default=str)
+
+    await asyncio.to_thread(write)
     return file_path
 
 
-async def verify_url_accessible(url: str, expected_content_type: str = None) -> Tuple[bool, str]:
-    """Verify URL is accessible and returns expected content"""
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.head(url, follow_redirects=True)
+@functools.lru_cache(maxsize=16)
+def _read_text(path: Path, mtime: float) -> str:
+    return path.read_text()
 
-            if response.status_code != 200:
-                return False, f"HTTP {response.status_code}"
 
-            if expected_content_type:
-                content_type = response.headers.get("content-type", "")
-                if expected_content_type not in content_type:
-                    return False, f"Wrong content type: {content_type}"
+def read_text_cached(path: Path) -> str:
+    """Read a source/doc file once per modification, shared across tests"""
+    return _read_text(path, path.stat().st_mtime)
 
-            return True, "URL accessible"
+
+async def verify_url_accessible(url: str, expected_content_type: str = None) -> Tuple[bool, str]:
+    """
+    Verify URL is accessible and returns expected content
+
+    Transient R2 errors (429/5xx and network errors) are retried with
+    backoff; anything else, e.g. a 404, fails immediately since it means the
+    media is missing.
+    Some R2/Cloudflare setups reject HEAD (403/405), so those fall back to
+    a one-byte ranged GET whose body is never downloaded.
+    """
+    client = get_http_client()
+    try:
+        for attempt in range(1, URL_CHECK_ATTEMPTS + 1):
+            try:
+                response = await client.head(url, follow_redirects=True)
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == URL_CHECK_ATTEMPTS:
+                    break
+            except httpx.TransportError:
+                if attempt == URL_CHECK_ATTEMPTS:
+                    raise
+            await asyncio.sleep(2 ** attempt + random.uniform(0, 1))
+
+        if response.status_code in (403, 405):
+            # Only the status line and headers are read; leaving the stream
+            # closes it without pulling the (possibly multi-MB) body
+            async with client.stream(
+                "GET", url, headers={"Range": "bytes=0-0"}, follow_redirects=True
+            ) as response:
+                pass
+
+        if response.status_code not in (200, 206):
+            return False, f"HTTP {response.status_code}"
+
+        if expected_content_type:
+            content_type = response.headers.get("content-type", "")
+            if expected_content_type not in content_type:
+                return False, f"Wrong content type: {content_type}"
+
+        return True, "URL accessible"
     except Exception as e:
         return False, f"Error: {str(e)}"
 
 
+# Setup runs per business URL; tests share the first successful one
+_campaign_setups: Dict[str, asyncio.Task] = {}
+
+
 async def setup_test_campaign() -> Tuple[str, str, str]:
     """
     Setup test campaign by running Agent 1 and Agent 2.
 
+    Agents 1 and 2 take several minutes and their output only depends on
+    TEST_BUSINESS_URL, so the setup runs once per URL: later (or concurrent)
+    callers get the same campaign. content:store upserts by campaign_id, so
+    running Agent 3 on it more than once is safe. A failed setup is not
+    cached, so the next caller retries it.
+
     Returns:
         (campaign_id, business_name, status)
     """
+    task = _campaign_setups.get(TEST_BUSINESS_URL)
+    created = task is None
+    if created:
+        task = asyncio.ensure_future(_run_test_campaign_setup())
+        _campaign_setups[TEST_BUSINESS_URL] = task
+    elif not task.done():
+        print("⏳ Waiting for the in-progress test campaign setup...")
+
+    result = await task
+    if "failed" in result[2]:
+        if _campaign_setups.get(TEST_BUSINESS_URL) is task:
+            del _campaign_setups[TEST_BUSINESS_URL]
+            print("  Cleared the failed setup; the next test will retry it")
+    elif created:
+        print(f"✓ Created test campaign: {result[0]}")
+    else:
+        print(f"♻️  Reusing test campaign: {result[0]}")
+    return result
+
+
+async def _run_test_campaign_setup() -> Tuple[str, str, str]:
+    """Run Agent 1 and Agent 2 for a new test campaign"""
     print("\n" + "="*60)
     print("SETUP: Running Agent 1 (Research) and Agent 2 (Strategy)")
     print("="*60)
@@ -245,7 +348,7 @@ async def test_creative_agent_full_workflow():
         print(f"\n✓ Creative Agent complete in {duration:.1f} seconds ({duration/60:.1f} minutes)")
 
         # Save output to JSON
-        output_file = save_json(
+        output_file = await save_json(
             creative_output.model_dump(),
             f"creative_output_{campaign_id}.json"
         )
@@ -311,36 +414,65 @@ async def test_creative_agent_full_workflow():
         else:
             checks.append("✗ Learning data: Missing")
 
-        # Check 5: Verify R2 URLs accessible
-        print("\n📡 Verifying R2 URLs are accessible...")
-        url_checks = []
+        # Check 5: Final progress written (updates are batched during the run)
+        final_progress = await convex_service.get_progress(campaign_id)
+        if final_progress and final_progress.percentage == 100 and final_progress.status == "completed":
+            checks.append("✓ Progress: 100% (completed)")
+        else:
+            checks.append(
+                f"✗ Progress: expected 100% completed, got "
+                f"{f'{final_progress.percentage}% ({final_progress.status})' if final_progress else 'None'}"
+            )
+
+        # Check 6: Per-phase timings, to show where the run's time went
+        if creative_output.telemetry:
+            phase_totals: Dict[str, float] = {}
+            for entry in creative_output.telemetry:
+                phase_totals[entry["phase"]] = phase_totals.get(entry["phase"], 0.0) + entry["seconds"]
+
+            print("\n⏱ Time per phase (summed across days):")
+            for phase, seconds in sorted(phase_totals.items(), key=lambda item: item[1], reverse=True):
+                print(f"  - {phase}: {seconds:.1f}s")
+
+            slowest = max(phase_totals, key=phase_totals.get)
+            checks.append(f"✓ Telemetry: {len(creative_output.telemetry)} timings, slowest phase: {slowest}")
+        else:
+            checks.append("✗ Telemetry: Missing")
 
+        # Check 7: Verify R2 URLs accessible
+        print("\n📡 Verifying R2 URLs are accessible...")
+        # (label, url, expected content type) for every media URL
+        media = []
         for day_content in creative_output.days:
             day_num = day_content.day
 
-            # Check image URLs
             for i, image_url in enumerate(day_content.image_urls):
-                accessible, message = await verify_url_accessible(
-                    str(image_url),
-                    expected_content_type="image"
-                )
-
-                if accessible:
-                    url_checks.append(f"✓ Day {day_num} Image {i+1}: {message}")
-                else:
-                    url_checks.append(f"✗ Day {day_num} Image {i+1}: {message}")
+                media.append((f"Day {day_num} Image {i+1}", str(image_url), "image"))
 
-            # Check video URL
             if day_content.video_url:
-                accessible, message = await verify_url_accessible(
-                    str(day_content.video_url),
-                    expected_content_type="video"
-                )
-
-                if accessible:
-                    url_checks.append(f"✓ Day {day_num} Video: {message}")
-                else:
-                    url_checks.append(f"✗ Day {day_num} Video: {message}")
+                media.append((f"Day {day_num} Video", str(day_content.video_url), "video"))
+
+        # The checks are independent, so run them concurrently, bounded so
+        # the shared client doesn't open too many connections to R2
+        sem = asyncio.Semaphore(MAX_CONCURRENT_URL_CHECKS)
+
+        async def check_bounded(index: int, url: str, content_type: str) -> Tuple[int, bool, str]:
+            async with sem:
+                accessible, message = await verify_url_accessible(url, expected_content_type=content_type)
+                return index, accessible, message
+
+        # Print each result as its check finishes so failures show up early;
+        # url_checks is filled by index to keep the day/media order
+        url_checks = [""] * len(media)
+        pending = [
+            check_bounded(index, url, content_type)
+            for index, (_, url, content_type) in enumerate(media)
+        ]
+
+        for done, next_result in enumerate(asyncio.as_completed(pending), start=1):
+            index, accessible, message = await next_result
+            url_checks[index] = f"{'✓' if accessible else '✗'} {media[index][0]}: {message}"
+            print(f"  [{done}/{len(media)}] {url_checks[index]}")
 
         # Compile results
         all_checks = checks + url_checks
@@ -385,8 +517,7 @@ async def test_creative_agent_quality_evaluation():
         # Check if quality evaluation is mentioned in agent code
         agent_file = Path(__file__).parent.parent / "agents" / "creative_agent.py"
 
-        with open(agent_file, "r") as f:
-            agent_code = f.read()
+        agent_code = read_text_cached(agent_file)
 
         # Look for quality evaluation references
         has_quality_reference = "quality" in agent_code.lower()
@@ -413,11 +544,10 @@ async def test_creative_agent_quality_evaluation():
         # Check CLAUDE.md for quality requirements
         claude_file = Path(__file__).parent.parent.parent / "CLAUDE.md"
 
-        with open(claude_file, "r") as f:
-            claude_md = f.read()
+        claude_md = read_text_cached(claude_file).lower()
 
-        has_quality_driven = "quality-driven" in claude_md.lower()
-        has_regeneration = "regenerat" in claude_md.lower()
+        has_quality_driven = "quality-driven" in claude_md
+        has_regeneration = "regenerat" in claude_md
 
         if has_quality_driven:
             checks.append("✓ Quality-driven principle in CLAUDE.md")
@@ -440,6 +570,70 @@ async def test_creative_agent_quality_evaluation():
         log_test_result(test_name, False, f"Exception: {str(e)}")
 
 
+async def test_creative_agent_checkpoint_roundtrip():
+    """
+    Test creative progress checkpointing (no API calls).
+
+    Expected:
+    - Saved state loads back unchanged, including completed DayContent
+    - Missing checkpoint loads as {}
+    - clear() removes the checkpoint
+    """
+    test_name = "test_creative_agent_checkpoint_roundtrip"
+    print(f"\n{'='*60}")
+    print(f"Running: {test_name}")
+    print(f"{'='*60}")
+
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            checkpointer = CreativeCheckpointer(Path(checkpoint_dir))
+            campaign_id = f"test_checkpoint_{uuid.uuid4().hex[:8]}"
+
+            day = DayContent(
+                day=1,
+                theme="Opening day",
+                caption="Fresh roasts every morning at our new location",
+                hashtags=["#coffee"],
+                image_urls=["https://example.com/day_1_image_1.jpg"],
+                video_url=None,
+                cta="Visit us today",
+                recommended_post_time="10:00 AM"
+            )
+            state = {
+                "strategy": {"days": [{"day": 1, "theme": "Opening day"}]},
+                "days": {"1": day.model_dump(mode="json")}
+            }
+
+            checks = []
+
+            if checkpointer.load(campaign_id) == {}:
+                checks.append("✓ Missing checkpoint loads as empty state")
+            else:
+                checks.append("✗ Missing checkpoint did not load as empty state")
+
+            checkpointer.save(campaign_id, state)
+            loaded = checkpointer.load(campaign_id)
+
+            if loaded == state and DayContent.model_validate(loaded["days"]["1"]) == day:
+                checks.append("✓ Checkpoint round-trips strategy and completed days")
+            else:
+                checks.append("✗ Loaded checkpoint differs from saved state")
+
+            checkpointer.clear(campaign_id)
+            if checkpointer.load(campaign_id) == {}:
+                checks.append("✓ clear() removes the checkpoint")
+            else:
+                checks.append("✗ Checkpoint still present after clear()")
+
+        result_message = "\n".join(f"  {check}" for check in checks)
+        passed = all(c.startswith("✓") for c in checks)
+
+        log_test_result(test_name, passed, result_message)
+
+    except Exception as e:
+        log_test_result(test_name, False, f"Exception: {str(e)}")
+
+
 async def test_creative_agent_image_generation():
     """
     Test image generation for a single day.
@@ -485,11 +679,28 @@ async def test_creative_agent_image_generation():
 
         print(f"✓ Generated {len(image_bytes_list)} images")
 
-        # Upload to R2
-        image_urls = []
+        # Upload to R2; the uploads are independent, so run them concurrently
+        image_urls = await asyncio.gather(*(
+            r2_service.upload_bytes(
+                data=img_bytes,
+                object_key=r2_service.get_campaign_path(
+                    test_campaign_id,
+                    f"test_image_{i+1}.jpg"
+                ),
+                content_type="image/jpeg"
+            )
+            for i, img_bytes in enumerate(image_bytes_list)
+        ))
+
+        # Verify URLs accessible, also concurrently
+        url_results = await asyncio.gather(*(
+            verify_url_accessible(image_url, expected_content_type="image")
+            for image_url in image_urls
+        ))
+
         checks = []
 
-        for i, img_bytes in enumerate(image_bytes_list):
+        for i, (img_bytes, (accessible, message)) in enumerate(zip(image_bytes_list, url_results)):
             # Check size
             size_kb = len(img_bytes) / 1024
             if size_kb < MIN_IMAGE_SIZE_KB:
@@ -497,27 +708,8 @@ async def test_creative_agent_image_generation():
             else:
                 checks.append(f"✓ Image {i+1}: Valid size ({size_kb:.2f}KB)")
 
-            # Upload to R2
-            object_key = r2_service.get_campaign_path(
-                test_campaign_id,
-                f"test_image_{i+1}.jpg"
-            )
-
-            image_url = await r2_service.upload_bytes(
-                data=img_bytes,
-                object_key=object_key,
-                content_type="image/jpeg"
-            )
-
-            image_urls.append(image_url)
             checks.append(f"✓ Image {i+1}: Uploaded to R2")
 
-            # Verify URL accessible
-            accessible, message = await verify_url_accessible(
-                image_url,
-                expected_content_type="image"
-            )
-
             if accessible:
                 checks.append(f"✓ Image {i+1}: URL accessible")
             else:
@@ -596,40 +788,49 @@ async def test_creative_agent_video_generation():
         print("\n🎬 Generating video (this will take 3-5 minutes)...")
         motion_prompt = "Slow zoom into the coffee shop, warm lighting gradually illuminates the interior, smooth camera movement"
 
-        video_bytes = await minimax_service.generate_video(
+        video_file_url = await minimax_service.generate_video_url(
             motion_prompt=motion_prompt,
             first_frame_image_url=first_frame_url,
             duration=6
         )
 
-        if not video_bytes:
+        if not video_file_url:
             log_test_result(test_name, False, "Video generation returned None")
             return
 
-        print(f"✓ Video generated ({len(video_bytes)/1024:.2f}KB)")
-
-        checks = []
-
-        # Check video size
-        video_size_kb = len(video_bytes) / 1024
-        if video_size_kb < MIN_VIDEO_SIZE_KB:
-            checks.append(f"✗ Video too small ({video_size_kb:.2f}KB < {MIN_VIDEO_SIZE_KB}KB)")
-        else:
-            checks.append(f"✓ Video size valid ({video_size_kb:.2f}KB)")
+        print("✓ Video generated")
 
-        # Step 4: Upload video to R2
-        print("\n☁️ Uploading video to R2...")
+        # Step 4: Stream video from MiniMax to R2, counting bytes on the way
+        # so the size check doesn't need the whole video in memory
+        print("\n☁️ Streaming video to R2...")
         video_key = r2_service.get_campaign_path(
             test_campaign_id,
             "test_video.mp4"
         )
 
-        video_url = await r2_service.upload_bytes(
-            data=video_bytes,
+        video_size = 0
+
+        async def counted_chunks():
+            nonlocal video_size
+            async for chunk in minimax_service.stream_video(video_file_url):
+                video_size += len(chunk)
+                yield chunk
+
+        video_url = await r2_service.upload_stream(
+            chunks=counted_chunks(),
             object_key=video_key,
             content_type="video/mp4"
         )
 
+        checks = []
+
+        # Check video size
+        video_size_kb = video_size / 1024
+        if video_size_kb < MIN_VIDEO_SIZE_KB:
+            checks.append(f"✗ Video too small ({video_size_kb:.2f}KB < {MIN_VIDEO_SIZE_KB}KB)")
+        else:
+            checks.append(f"✓ Video size valid ({video_size_kb:.2f}KB)")
+
         checks.append(f"✓ Video uploaded to R2")
         print(f"✓ Video URL: {video_url}")
 
@@ -815,7 +1016,7 @@ async def test_creative_agent_learning_extraction():
             checks.append("✗ next_iteration_strategy: None")
 
         # Save learning data
-        learning_file = save_json(
+        learning_file = await save_json(
             learning_data.model_dump(),
             f"learning_data_{campaign_id}.json"
         )
@@ -930,13 +1131,21 @@ async def main():
     print("\nRunning FULL TEST suite...")
     print("Grab a coffee - this will take 15-20 minutes ☕")
 
-    # Quick tests first (no full workflow)
-    await test_creative_agent_quality_evaluation()
-    await test_creative_agent_error_handling()
+    # Quick tests and component tests don't depend on each other (each uses
+    # its own campaign), so run them concurrently; total time is then the
+    # slowest of them (video generation) rather than the sum. Their output
+    # may interleave, so results are put back in this order for the summary
+    independent_tests = [
+        test_creative_agent_quality_evaluation,
+        test_creative_agent_error_handling,
+        test_creative_agent_checkpoint_roundtrip,
+        test_creative_agent_image_generation,
+        test_creative_agent_video_generation,
+    ]
+    await asyncio.gather(*(test() for test in independent_tests))
 
-    # Component tests
-    await test_creative_agent_image_generation()
-    await test_creative_agent_video_generation()
+    test_order = [test.__name__ for test in independent_tests]
+    test_results.sort(key=lambda r: test_order.index(r["name"]))
 
     # Full workflow test (SLOW)
     await test_creative_agent_full_workflow()
@@ -945,6 +1154,8 @@ async def main():
     # Note: This is redundant if full_workflow already ran
     # await test_creative_agent_learning_extraction()
 
+    await close_http_client()
+
     # Print summary
     success = print_summary()
 
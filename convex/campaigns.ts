@@ -1,5 +1,6 @@
 import { mutation, query } from "./_generated/server";
 import { v } from "convex/values";
+import { Doc } from "./_generated/dataModel";
 
 // Create new campaign
 export const create = mutation({
@@ -74,14 +75,86 @@ export const getProgress = query({
       return null;
     }
 
+    return toProgress(campaign);
+  },
+});
+
+// Get research, analytics and progress for a campaign in one round-trip
+export const getFull = query({
+  args: {
+    campaign_id: v.string(),
+  },
+  handler: async (ctx, args) => {
+    const [campaign, research, analytics] = await Promise.all([
+      ctx.db
+        .query("campaigns")
+        .withIndex("by_campaign_id", (q) => q.eq("campaign_id", args.campaign_id))
+        .first(),
+      ctx.db
+        .query("research")
+        .withIndex("by_campaign_id", (q) => q.eq("campaign_id", args.campaign_id))
+        .first(),
+      ctx.db
+        .query("analytics")
+        .withIndex("by_campaign_id", (q) => q.eq("campaign_id", args.campaign_id))
+        .first(),
+    ]);
+
     return {
-      campaign_id: campaign.campaign_id,
-      status: campaign.status,
-      percentage: campaign.progress,
-      current_agent: campaign.current_agent,
-      message: campaign.message,
-      created_at: campaign.created_at,
-      updated_at: campaign.updated_at,
+      research: research ?? null,
+      analytics: analytics ?? null,
+      progress: campaign ? toProgress(campaign) : null,
     };
   },
 });
+
+// Shape a campaign document as the progress record returned to clients
+function toProgress(campaign: Doc<"campaigns">) {
+  return {
+    campaign_id: campaign.campaign_id,
+    status: campaign.status,
+    percentage: campaign.progress,
+    current_agent: campaign.current_agent,
+    message: campaign.message,
+    created_at: campaign.created_at,
+    updated_at: campaign.updated_at,
+  };
+}
+
+// Delete campaigns and their research, analytics and content records
+export const bulkDelete = mutation({
+  args: {
+    campaign_ids: v.array(v.string()),
+  },
+  handler: async (ctx, args) => {
+    const perCampaign = await Promise.all(
+      args.campaign_ids.map(async (campaign_id) => {
+        const docs = (
+          await Promise.all([
+            ctx.db
+              .query("campaigns")
+              .withIndex("by_campaign_id", (q) => q.eq("campaign_id", campaign_id))
+              .collect(),
+            ctx.db
+              .query("research")
+              .withIndex("by_campaign_id", (q) => q.eq("campaign_id", campaign_id))
+              .collect(),
+            ctx.db
+              .query("analytics")
+              .withIndex("by_campaign_id", (q) => q.eq("campaign_id", campaign_id))
+              .collect(),
+            ctx.db
+              .query("content")
+              .withIndex("by_campaign_id", (q) => q.eq("campaign_id", campaign_id))
+              .collect(),
+          ])
+        ).flat();
+
+        await Promise.all(docs.map((doc) => ctx.db.delete(doc._id)));
+        return docs.length;
+      })
+    );
+
+    return { deleted: perCampaign.reduce((a, b) => a + b, 0) };
+  },
+});